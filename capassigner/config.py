@@ -106,6 +106,14 @@ DEFAULT_NUM_SOLUTIONS: Final[int] = 10
 # Progress callback update frequency (every N iterations)
 PROGRESS_UPDATE_FREQUENCY: Final[int] = 50
 
+# SP Graph topology generation fans out to a process pool from this many
+# edges (smaller sweeps finish faster than the pool starts)
+PARALLEL_TOPOLOGY_MIN_EDGES: Final[int] = 6
+
+# Graph C_eq switches to a sparse (SciPy) solve from this many nodes; below
+# it the dense solve is faster than building the sparse matrix
+SPARSE_LAPLACIAN_MIN_NODES: Final[int] = 64
+
 
 # ============================================================================
 # Educational Transparency (Principle VI)
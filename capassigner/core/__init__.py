@@ -41,6 +41,7 @@ from capassigner.core.metrics import (
     Solution,
 )
 from capassigner.core.graphs import (
+    GraphLaplacianSolver,
     GraphTopology,
     build_laplacian_matrix,
     is_connected_between_terminals,
@@ -70,6 +71,7 @@ __all__ = [
     "ProgressCallback",
     "Solution",
     # Graph Types
+    "GraphLaplacianSolver",
     "GraphTopology",
     "build_laplacian_matrix",
     "is_connected_between_terminals",
@@ -13,12 +13,25 @@ Requirements: FR-003 to FR-007
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+import warnings
 
 import networkx as nx
 import numpy as np
 
+# SciPy is optional: large networks use a sparse solve when it is available
+try:
+    from scipy.sparse import coo_matrix, csr_matrix
+    from scipy.sparse.linalg import MatrixRankWarning, SuperLU, splu, spsolve
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from capassigner.config import SPARSE_LAPLACIAN_MIN_NODES
+
 
 @dataclass
 class GraphTopology:
@@ -71,29 +84,36 @@ def build_laplacian_matrix(graph: nx.Graph) -> Tuple[np.ndarray, List[str]]:
         >>> # L = [[5e-12, -5e-12], [-5e-12, 5e-12]]
     """
     nodes = list(graph.nodes())
-    n = len(nodes)
-    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    return _laplacian_from_edges(len(nodes), _indexed_edges(graph, nodes)), nodes
+
+
+# An edge as (row index, column index, capacitance) in a node ordering
+IndexedEdge = Tuple[int, int, float]
 
-    # Initialize Laplacian matrix with zeros
-    L = np.zeros((n, n), dtype=np.float64)
 
-    # Build Laplacian from edges
+def _indexed_edges(graph: nx.Graph, nodes: List[str]) -> Tuple[IndexedEdge, ...]:
+    """Return the graph's edges as index triples in graph.edges() order."""
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
+    edges = []
     for u, v, data in graph.edges(data=True):
         if 'capacitance' not in data:
             raise ValueError("All edges must have 'capacitance' attribute")
+        edges.append((node_to_idx[u], node_to_idx[v], data['capacitance']))
+    return tuple(edges)
 
-        cap = data['capacitance']
-        i, j = node_to_idx[u], node_to_idx[v]
-
-        # Off-diagonal: -C_ij
-        L[i, j] -= cap
-        L[j, i] -= cap
 
-        # Diagonal: +C_ij for both nodes
-        L[i, i] += cap
-        L[j, j] += cap
+def _laplacian_from_edges(n: int, edges: Tuple[IndexedEdge, ...]) -> np.ndarray:
+    """Accumulate the n x n Laplacian of indexed capacitor edges."""
+    i, j, cap = np.array(edges, dtype=np.float64).reshape(-1, 3).T
+    i = i.astype(np.intp)
+    j = j.astype(np.intp)
 
-    return L, nodes
+    # Per edge: off-diagonal -C_ij at (i, j) and (j, i), diagonal +C_ij at
+    # (i, i) and (j, j). Interleaving keeps each entry's sum in edge order.
+    flat = np.column_stack((i * n + j, j * n + i, i * (n + 1), j * (n + 1))).ravel()
+    weights = np.column_stack((-cap, -cap, cap, cap)).ravel()
+    L = np.bincount(flat, weights=weights, minlength=n * n)
+    return L.astype(np.float64, copy=False).reshape(n, n)
 
 
 def is_connected_between_terminals(
@@ -121,13 +141,314 @@ def is_connected_between_terminals(
     if terminal_a not in graph or terminal_b not in graph:
         return False
 
-    return nx.has_path(graph, terminal_a, terminal_b)
+    # Breadth-first search that stops as soon as B is reached
+    adj = graph.adj
+    seen = {terminal_a}
+    queue = deque([terminal_a])
+    while queue:
+        node = queue.popleft()
+        if node == terminal_b:
+            return True
+        for neighbor in adj[node]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return False
+
+
+def _sparse_laplacian(n: int, edges: Tuple[IndexedEdge, ...]) -> csr_matrix:
+    """Assemble the n x n Laplacian of indexed capacitor edges in CSR form (SciPy)."""
+    edge_array = np.array(edges, dtype=np.float64).reshape(-1, 3)
+    i = edge_array[:, 0].astype(np.intp)
+    j = edge_array[:, 1].astype(np.intp)
+    cap = edge_array[:, 2]
+    return coo_matrix(
+        (np.concatenate((-cap, -cap, cap, cap)),
+         (np.concatenate((i, j, i, j)), np.concatenate((j, i, i, j)))),
+        shape=(n, n),
+    ).tocsr()
+
+
+def _solve_sparse(
+    n: int,
+    edges: Tuple[IndexedEdge, ...],
+    internal_indices: List[int],
+    idx_a: int
+) -> Optional[np.ndarray]:
+    """Solve internal node voltages with a sparse Laplacian (SciPy).
+
+    Memory and work scale with the number of edges instead of n^2 / n^3.
+
+    Returns:
+        Internal node voltages, or None if the reduced system is singular
+        or the result is not finite (the caller then uses the dense path).
+    """
+    L = _sparse_laplacian(n, edges)
+    L_internal = L[internal_indices]
+    rhs = -L_internal[:, [idx_a]].toarray().ravel()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", MatrixRankWarning)
+        try:
+            V_internal = spsolve(L_internal[:, internal_indices].tocsc(), rhs)
+        except (MatrixRankWarning, RuntimeError):
+            return None
+    return V_internal if np.all(np.isfinite(V_internal)) else None
+
+
+def _solve_dense(
+    n: int,
+    edges: Tuple[IndexedEdge, ...],
+    internal_indices: List[int],
+    idx_a: int
+) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Solve internal node voltages with a dense Laplacian.
+
+    Returns:
+        Tuple of (internal node voltages or None, warning message or None).
+    """
+    L = _laplacian_from_edges(n, edges)
+    warning_message = None
+
+    # Extract reduced Laplacian for internal nodes
+    # L_reduced * V_internal = -L_ai * V_a - L_bi * V_b
+    # With V_a = 1, V_b = 0:
+    # L_reduced * V_internal = -L_ai (column of L for terminal A at internal rows)
+
+    L_reduced = L[np.ix_(internal_indices, internal_indices)]
+
+    # Right-hand side: -L[internal, a] * 1 - L[internal, b] * 0 = -L[internal, a]
+    rhs = -L[internal_indices, idx_a]
+
+    # Solve for internal node voltages
+    try:
+        # Check condition number for numerical stability
+        cond = np.linalg.cond(L_reduced)
+        if cond > 1e12:
+            # Near-singular: add small regularization
+            L_reduced += 1e-15 * np.eye(len(internal_indices))
+            warning_message = "Warning: Near-singular matrix, using regularization"
+
+        V_internal = np.linalg.solve(L_reduced, rhs)
+
+    except np.linalg.LinAlgError:
+        # Singular matrix: use pseudo-inverse
+        try:
+            V_internal = np.linalg.pinv(L_reduced) @ rhs
+            warning_message = "Warning: Singular matrix, using pseudo-inverse"
+        except Exception:
+            return None, "Error: Cannot solve matrix system"
+
+    # Check for NaN or Inf
+    if np.any(np.isnan(V_internal)) or np.any(np.isinf(V_internal)):
+        return None, "Error: Numerical instability in solution"
+
+    return V_internal, warning_message
+
+
+def _reduce_sp(
+    graph: nx.Graph,
+    terminal_a: Hashable,
+    terminal_b: Hashable
+) -> Optional[float]:
+    """Reduce a network by series/parallel elimination of internal nodes.
+
+    Internal nodes of degree 2 are replaced by one edge of c1*c2/(c1+c2),
+    added in parallel to any existing edge between their neighbours.
+    Dangling internal nodes (degree 0 or 1) carry no charge and are dropped,
+    and self-loops are ignored.
+
+    Returns:
+        C_eq if the network collapses to a single A-B edge, otherwise None
+        (the caller then solves the Laplacian system).
+
+    Raises:
+        ValueError: If any edge is missing the 'capacitance' attribute.
+    """
+    adj: Dict[Hashable, Dict[Hashable, float]] = {node: {} for node in graph}
+    for u, v, data in graph.edges(data=True):
+        if 'capacitance' not in data:
+            raise ValueError("All edges must have 'capacitance' attribute")
+        # A self-loop has both plates on one node and stores no charge
+        if u != v:
+            adj[u][v] = adj[v][u] = data['capacitance']
+
+    pending = deque(node for node in adj if len(adj[node]) <= 2)
+    while pending:
+        node = pending.popleft()
+        if node == terminal_a or node == terminal_b or node not in adj:
+            continue
+        neighbors = adj[node]
+        if len(neighbors) == 2:
+            (u, c1), (v, c2) = neighbors.items()
+            if c1 + c2 == 0:
+                continue
+            adj[u][v] = adj[v][u] = adj[u].get(v, 0.0) + c1 * c2 / (c1 + c2)
+        elif len(neighbors) > 2:
+            continue
+        for neighbor in neighbors:
+            del adj[neighbor][node]
+        del adj[node]
+        for neighbor in neighbors:
+            if len(adj[neighbor]) <= 2:
+                pending.append(neighbor)
+
+    if len(adj) == 2 and terminal_b in adj[terminal_a]:
+        return adj[terminal_a][terminal_b]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _solve_node_voltages(
+    n: int,
+    edges: Tuple[IndexedEdge, ...],
+    idx_a: int,
+    idx_b: int
+) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """Solve node voltages for V_A = 1, V_B = 0 on indexed capacitor edges.
+
+    Cached on the exact edge list, so re-evaluating the same network (as
+    random search and repeated UI runs do) skips the Laplacian build,
+    condition check and solve.
+
+    Returns:
+        Tuple of (read-only voltage vector, warning message or None), or
+        (None, error message) if the system cannot be solved. Callers
+        handle the two-node case, so there is always an internal node.
+    """
+    # Find internal nodes (all nodes except A and B)
+    internal_indices = [i for i in range(n) if i != idx_a and i != idx_b]
+
+    warning_message = None
+
+    V_internal = None
+    if SCIPY_AVAILABLE and n >= SPARSE_LAPLACIAN_MIN_NODES:
+        V_internal = _solve_sparse(n, edges, internal_indices, idx_a)
+
+    if V_internal is None:
+        V_internal, warning_message = _solve_dense(n, edges, internal_indices, idx_a)
+        if V_internal is None:
+            return None, warning_message
+
+    # Build full voltage vector: V[a]=1, V[b]=0, V[internal] from solution
+    V = np.zeros(n)
+    V[idx_a] = 1.0
+    V[idx_b] = 0.0
+    for i, idx in enumerate(internal_indices):
+        V[idx] = V_internal[i]
+
+    V.setflags(write=False)
+    return V, warning_message
+
+
+class GraphLaplacianSolver:
+    """Equivalent capacitance between any terminal pair of one network.
+
+    Grounds one node per connected component and factors the grounded
+    Laplacian once. With SciPy and at least SPARSE_LAPLACIAN_MIN_NODES
+    nodes the factorization is a sparse LU (splu) and each query is one
+    pair of triangular solves; otherwise the grounded Laplacian is
+    inverted densely and each query is an O(1) lookup:
+    C_eq(a, b) = 1 / (G[a, a] + G[b, b] - 2 * G[a, b]), with G zero at
+    grounded nodes. Use it when many terminal pairs are evaluated on the
+    same capacitor network.
+
+    Example:
+        >>> G = nx.Graph()
+        >>> G.add_edge('A', 'n1', capacitance=10e-12)
+        >>> G.add_edge('n1', 'B', capacitance=10e-12)
+        >>> solver = GraphLaplacianSolver(G)
+        >>> ceq, warning = solver.ceq('A', 'B')  # 5e-12
+    """
+
+    def __init__(self, graph: nx.Graph) -> None:
+        """Factor the grounded Laplacian of graph.
+
+        Raises:
+            ValueError: If any edge is missing the 'capacitance' attribute.
+        """
+        nodes = list(graph.nodes())
+        self.node_to_idx: Dict[Hashable, int] = {node: i for i, node in enumerate(nodes)}
+        self.component: Dict[Hashable, int] = {}
+        grounded: Set[int] = set()
+        for k, members in enumerate(nx.connected_components(graph)):
+            grounded.add(self.node_to_idx[next(iter(members))])
+            for node in members:
+                self.component[node] = k
+
+        # Position of each non-grounded node in the grounded system
+        kept = [i for i in range(len(nodes)) if i not in grounded]
+        self.position: Dict[int, int] = {idx: pos for pos, idx in enumerate(kept)}
+        self.warning: Optional[str] = None
+        self.lu: Optional[SuperLU] = None
+        # Dense inverse of the grounded Laplacian; left empty when lu is set
+        self.inverse: np.ndarray = np.empty((0, 0))
+
+        edges = _indexed_edges(graph, nodes)
+        if SCIPY_AVAILABLE and len(nodes) >= SPARSE_LAPLACIAN_MIN_NODES:
+            L_sparse = _sparse_laplacian(len(nodes), edges)
+            try:
+                self.lu = splu(L_sparse[kept][:, kept].tocsc())
+            except RuntimeError:
+                # Exactly singular: fall back to the dense pseudo-inverse
+                self.lu = None
+        if self.lu is None:
+            L_grounded = _laplacian_from_edges(len(nodes), edges)[np.ix_(kept, kept)]
+            try:
+                self.inverse = np.linalg.inv(L_grounded)
+            except np.linalg.LinAlgError:
+                self.inverse = np.linalg.pinv(L_grounded)
+                self.warning = "Warning: Singular matrix, using pseudo-inverse"
+
+    def ceq(
+        self,
+        terminal_a: str = 'A',
+        terminal_b: str = 'B'
+    ) -> Tuple[float, Optional[str]]:
+        """Return (C_eq in Farads, warning message or None) between two nodes.
+
+        Raises:
+            ValueError: If terminal_a or terminal_b not in the graph, or if
+                they are the same node.
+        """
+        for terminal in (terminal_a, terminal_b):
+            if terminal not in self.node_to_idx:
+                raise ValueError(f"Terminal '{terminal}' must be a node in graph")
+        if terminal_a == terminal_b:
+            raise ValueError("Terminals A and B must be different nodes")
+        if self.component[terminal_a] != self.component[terminal_b]:
+            return 0.0, "No path between A and B"
+
+        # Grounded nodes have no row and sit at potential 0
+        a = self.position.get(self.node_to_idx[terminal_a])
+        b = self.position.get(self.node_to_idx[terminal_b])
+        if self.lu is not None:
+            # Inject unit charge at A, withdraw it at B, read V_A - V_B
+            rhs = np.zeros(len(self.position))
+            if a is not None:
+                rhs[a] = 1.0
+            if b is not None:
+                rhs[b] = -1.0
+            V = self.lu.solve(rhs)
+            elastance = (V[a] if a is not None else 0.0) - (V[b] if b is not None else 0.0)
+        else:
+            G = self.inverse
+            elastance = 0.0
+            if a is not None:
+                elastance += G[a, a]
+            if b is not None:
+                elastance += G[b, b]
+            if a is not None and b is not None:
+                elastance -= 2.0 * G[a, b]
+        if not np.isfinite(elastance) or elastance <= 0:
+            return 0.0, "Error: Numerical instability in solution"
+        return float(1.0 / elastance), self.warning
 
 
 def calculate_graph_ceq(
     graph: nx.Graph,
     terminal_a: str = 'A',
-    terminal_b: str = 'B'
+    terminal_b: str = 'B',
+    solver: Optional[GraphLaplacianSolver] = None
 ) -> Tuple[float, Optional[str]]:
     """Calculate equivalent capacitance using Laplacian matrix method.
 
@@ -139,6 +460,8 @@ def calculate_graph_ceq(
         graph: NetworkX graph with 'capacitance' edge attribute (in Farads).
         terminal_a: Node identifier for terminal A.
         terminal_b: Node identifier for terminal B.
+        solver: Optional GraphLaplacianSolver built from this same graph;
+            when given, C_eq is read from its cached factorization.
 
     Returns:
         Tuple of (C_eq in Farads, warning message or None).
@@ -164,6 +487,9 @@ def calculate_graph_ceq(
     if terminal_b not in graph:
         raise ValueError(f"Terminal '{terminal_b}' must be a node in graph")
 
+    if solver is not None:
+        return solver.ceq(terminal_a, terminal_b)
+
     # Check connectivity
     if not is_connected_between_terminals(graph, terminal_a, terminal_b):
         return 0.0, "No path between A and B"
@@ -179,66 +505,19 @@ def calculate_graph_ceq(
             total_cap += data['capacitance']
         return total_cap, None
 
-    # Build Laplacian matrix
-    L, node_list = build_laplacian_matrix(graph)
-    node_to_idx = {node: i for i, node in enumerate(node_list)}
-    n = len(node_list)
+    # Series/parallel-reducible networks need no linear solve
+    ceq = _reduce_sp(graph, terminal_a, terminal_b)
+    if ceq is not None:
+        return max(0.0, ceq), None
 
-    # Get indices for terminals
+    # Solve (or reuse) node voltages for this exact edge list
+    node_to_idx = {node: i for i, node in enumerate(nodes)}
     idx_a = node_to_idx[terminal_a]
-    idx_b = node_to_idx[terminal_b]
-
-    # Find internal nodes (all nodes except A and B)
-    internal_indices = [i for i in range(n) if i != idx_a and i != idx_b]
-
-    warning_message = None
-
-    if len(internal_indices) == 0:
-        # Only A and B nodes: C_eq is sum of all edge capacitances (parallel)
-        total_cap = 0.0
-        for u, v, data in graph.edges(data=True):
-            total_cap += data['capacitance']
-        return total_cap, None
-
-    # Extract reduced Laplacian for internal nodes
-    # L_reduced * V_internal = -L_ai * V_a - L_bi * V_b
-    # With V_a = 1, V_b = 0:
-    # L_reduced * V_internal = -L_ai (column of L for terminal A at internal rows)
-
-    L_reduced = L[np.ix_(internal_indices, internal_indices)]
-
-    # Right-hand side: -L[internal, a] * 1 - L[internal, b] * 0 = -L[internal, a]
-    rhs = -L[internal_indices, idx_a]
-
-    # Solve for internal node voltages
-    try:
-        # Check condition number for numerical stability
-        cond = np.linalg.cond(L_reduced)
-        if cond > 1e12:
-            # Near-singular: add small regularization
-            L_reduced += 1e-15 * np.eye(len(internal_indices))
-            warning_message = "Warning: Near-singular matrix, using regularization"
-
-        V_internal = np.linalg.solve(L_reduced, rhs)
-
-    except np.linalg.LinAlgError:
-        # Singular matrix: use pseudo-inverse
-        try:
-            V_internal = np.linalg.pinv(L_reduced) @ rhs
-            warning_message = "Warning: Singular matrix, using pseudo-inverse"
-        except Exception:
-            return 0.0, "Error: Cannot solve matrix system"
-
-    # Check for NaN or Inf
-    if np.any(np.isnan(V_internal)) or np.any(np.isinf(V_internal)):
-        return 0.0, "Error: Numerical instability in solution"
-
-    # Build full voltage vector: V[a]=1, V[b]=0, V[internal] from solution
-    V = np.zeros(n)
-    V[idx_a] = 1.0
-    V[idx_b] = 0.0
-    for i, idx in enumerate(internal_indices):
-        V[idx] = V_internal[i]
+    V, warning_message = _solve_node_voltages(
+        len(nodes), _indexed_edges(graph, nodes), idx_a, node_to_idx[terminal_b]
+    )
+    if V is None:
+        return 0.0, warning_message
 
     # Calculate current into terminal A: I_a = sum over neighbors of (C_aj * (V_a - V_j))
     I_a = 0.0
@@ -15,11 +15,13 @@ from functools import lru_cache
 from itertools import combinations
 import math
 
+import numpy as np
+
 from capassigner.core.sp_structures import (
     Leaf, Series, Parallel, SPNode, 
-    calculate_sp_ceq, sp_node_to_expression, sp_node_to_normalized_expression
+    calculate_sp_ceq, sp_node_to_expression, sp_nodes_to_normalized_expressions
 )
-from capassigner.core.metrics import Solution, ProgressUpdate, ProgressCallback, create_solution, rank_solutions
+from capassigner.core.metrics import Solution, ProgressUpdate, ProgressCallback, create_solution
 from capassigner.config import PROGRESS_UPDATE_FREQUENCY
 
 
@@ -189,6 +191,99 @@ def enumerate_sp_topologies(
     return result
 
 
+def enumerate_sp_ceqs(capacitors: List[float]) -> np.ndarray:
+    """Compute C_eq of every SP topology without building the trees.
+
+    Runs the same subset recursion as enumerate_sp_topologies, but keeps one
+    contiguous float64 array per subset instead of node objects. Each split
+    combines whole arrays with broadcasting, so there is no Python work per
+    topology.
+
+    Args:
+        capacitors: List of capacitance values in Farads.
+
+    Returns:
+        Array where entry i is the C_eq of enumerate_sp_topologies(capacitors)[i],
+        bit-identical to calculate_sp_ceq on that tree.
+
+    Raises:
+        ValueError: If capacitors list is empty or contains non-positive values.
+
+    Examples:
+        >>> enumerate_sp_ceqs([5e-12, 10e-12]).tolist()
+        [3.333333333333333e-12, 1.5e-11]
+    """
+    if not capacitors:
+        raise ValueError("Cannot enumerate topologies with zero capacitors")
+    if any(c <= 0 for c in capacitors):
+        raise ValueError("All capacitor values must be positive")
+
+    cache = {}
+
+    def _ceqs_recursive(subset: FrozenSet[int]) -> np.ndarray:
+        """Return C_eq of every topology for a subset, in enumeration order."""
+        if subset in cache:
+            return cache[subset]
+
+        items = sorted(subset)
+        if len(items) == 1:
+            result = np.array([capacitors[items[0]]], dtype=np.float64)
+            cache[subset] = result
+            return result
+
+        # Same split order as enumerate_sp_topologies; each (left, right)
+        # pair contributes its Series value then its Parallel value
+        root = items[0]
+        rest = items[1:]
+        blocks = []
+        for k in range(len(rest) + 1):
+            for comb in combinations(rest, k):
+                left_indices = frozenset((root,) + comb)
+                right_indices = subset - left_indices
+                if not right_indices:
+                    continue
+
+                c_left = _ceqs_recursive(left_indices)[:, None]
+                c_right = _ceqs_recursive(right_indices)[None, :]
+                pair = np.empty((c_left.shape[0], c_right.shape[1], 2))
+                pair[:, :, 0] = 1.0 / (1.0 / c_left + 1.0 / c_right)
+                pair[:, :, 1] = c_left + c_right
+                blocks.append(pair.ravel())
+
+        cache[subset] = result = np.concatenate(blocks)
+        return result
+
+    return _ceqs_recursive(frozenset(range(len(capacitors))))
+
+
+def _top_k_pool(ceqs: np.ndarray, errors: np.ndarray, top_k: int) -> np.ndarray:
+    """Bound the topologies that can hold the top K after deduplication.
+
+    Duplicate topologies differ in C_eq only by rounding, far below
+    ``slack``. Bucketing C_eq by ``slack`` therefore puts each duplicate class
+    in at most two buckets, so the shortest best-error prefix spanning 2K
+    buckets holds at least K classes. Every class that can rank in the top K
+    then lies entirely within ``2 * slack`` of that prefix's worst error,
+    including the first-enumerated member that deduplication keeps.
+
+    Args:
+        ceqs: C_eq of every topology, in enumeration order.
+        errors: Absolute error of every topology.
+        top_k: Number of solutions that will be returned.
+
+    Returns:
+        Indices into ``ceqs`` in enumeration order; only these topologies
+        need to be normalized and ranked.
+    """
+    slack = 1e-9 * float(ceqs.max())
+    order = np.argsort(errors, kind='stable')
+    _, first_seen = np.unique(np.floor(ceqs[order] / slack), return_index=True)
+    if first_seen.size < 2 * max(top_k, 1):
+        return np.arange(len(ceqs))
+    bound = errors[order[np.sort(first_seen)[2 * max(top_k, 1) - 1]]] + 2 * slack
+    return np.flatnonzero(errors <= bound)
+
+
 def find_best_sp_solutions(
     capacitors: List[float],
     target: float,
@@ -228,40 +323,103 @@ def find_best_sp_solutions(
     if tolerance < 0:
         raise ValueError("Tolerance cannot be negative")
 
-    # Generate capacitor labels
-    capacitor_labels = [f"C{i+1}" for i in range(len(capacitors))]
-
     # Enumerate all SP topologies
     topologies = enumerate_sp_topologies(capacitors, progress_cb)
 
-    # Calculate C_eq and create solutions
-    solutions = []
-    seen_normalized = set()  # Track normalized expressions to detect true duplicates
-    
-    for topology in topologies:
-        try:
-            ceq = calculate_sp_ceq(topology)
-            
-            # Use normalized expression to detect structurally equivalent topologies
-            # This handles commutativity: (C1+C2) == (C2+C1), (C1||C2) == (C2||C1)
-            if deduplicate:
-                normalized = sp_node_to_normalized_expression(topology, capacitor_labels)
-                
-                # Skip duplicate topologies (same circuit, different tree structure)
-                if normalized in seen_normalized:
-                    continue
+    # Calculate C_eq for every topology as one array, aligned with topologies
+    ceqs = enumerate_sp_ceqs(capacitors)
+
+    return rank_sp_topologies(
+        topologies, capacitors, target, tolerance, top_k, deduplicate, ceqs
+    )
+
+
+def rank_sp_topologies(
+    topologies: List[SPNode],
+    capacitors: List[float],
+    target: float,
+    tolerance: float = 5.0,
+    top_k: int = 10,
+    deduplicate: bool = True,
+    ceqs: Optional[np.ndarray] = None
+) -> List[Solution]:
+    """Rank already enumerated SP topologies against a target.
+
+    The ranking half of find_best_sp_solutions, for callers that hold on to
+    the output of enumerate_sp_topologies and search it more than once.
+
+    Args:
+        topologies: Topologies built from capacitors (leaf i is capacitors[i]).
+        capacitors: Capacitance values in Farads, used for the C1..CN labels.
+        target: Target capacitance in Farads (must be > 0).
+        tolerance: Acceptable relative error percentage (default 5.0 for ±5%).
+        top_k: Number of best solutions to return (default 10).
+        deduplicate: If True, removes structurally equivalent topologies (default True).
+        ceqs: Optional C_eq of each topology, aligned with topologies (as from
+            enumerate_sp_ceqs). Computed per tree when omitted.
+
+    Returns:
+        Top-K solutions sorted by absolute error (best first).
+
+    Raises:
+        ValueError: If target <= 0 or tolerance < 0.
+
+    Examples:
+        >>> capacitors = [5e-12, 10e-12]
+        >>> topologies = enumerate_sp_topologies(capacitors)
+        >>> [s.expression for s in rank_sp_topologies(topologies, capacitors, 15e-12, top_k=1)]
+        ['(C1||C2)']
+    """
+    if target <= 0:
+        raise ValueError("Target capacitance must be positive")
+    if tolerance < 0:
+        raise ValueError("Tolerance cannot be negative")
+
+    # Generate capacitor labels
+    capacitor_labels = [f"C{i+1}" for i in range(len(capacitors))]
+
+    if ceqs is None:
+        ceqs = np.fromiter(
+            (calculate_sp_ceq(topology) for topology in topologies),
+            dtype=np.float64, count=len(topologies)
+        )
+
+    errors = np.abs(ceqs - target)
+
+    # Use normalized expression to detect structurally equivalent topologies
+    # This handles commutativity: (C1+C2) == (C2+C1), (C1||C2) == (C2||C1)
+    if deduplicate:
+        seen_normalized = set()  # Track normalized expressions to detect true duplicates
+        unique = []
+        pool = _top_k_pool(ceqs, errors, top_k).tolist()
+        normalized_pool = sp_nodes_to_normalized_expressions(
+            [topologies[index] for index in pool], capacitor_labels
+        )
+        for index, normalized in zip(pool, normalized_pool):
+            if normalized not in seen_normalized:
                 seen_normalized.add(normalized)
-            
-            # Use original (non-normalized) expression for display
-            expression = sp_node_to_expression(topology, capacitor_labels)
-            solution = create_solution(topology, ceq, target, tolerance, expression)
-            solutions.append(solution)
-        except (ZeroDivisionError, TypeError) as e:
-            # Skip invalid topologies (should not happen with valid input)
-            continue
-
-    # Rank by absolute error
-    ranked = rank_solutions(solutions)
-
-    # Return top K
-    return ranked[:top_k]
+                unique.append(index)
+        candidates = np.array(unique, dtype=np.intp)
+    else:
+        candidates = np.arange(len(topologies))
+
+    # Rank by absolute error: partition out the top K, keeping every value
+    # tied with the K-th so the stable order below matches a full sort
+    errors = errors[candidates]
+    if top_k < len(candidates):
+        cutoff = np.partition(errors, max(top_k - 1, 0))[max(top_k - 1, 0)]
+        keep = np.flatnonzero(errors <= cutoff)
+        candidates, errors = candidates[keep], errors[keep]
+    best = candidates[np.argsort(errors, kind='stable')[:top_k]]
+
+    # Build solutions (with display expressions) for the winners only
+    return [
+        create_solution(
+            topologies[index],
+            float(ceqs[index]),
+            target,
+            tolerance,
+            sp_node_to_expression(topologies[index], capacitor_labels),
+        )
+        for index in best.tolist()
+    ]
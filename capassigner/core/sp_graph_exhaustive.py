@@ -12,10 +12,15 @@ Constitutional Compliance:
 """
 
 from __future__ import annotations
-from typing import List, Optional, Any, Callable
-from itertools import combinations, combinations_with_replacement, permutations
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Callable, Sequence, Tuple
+import os
+from collections import deque
+from functools import lru_cache
+from multiprocessing import get_context
+from itertools import combinations, permutations
 import networkx as nx
 
+from capassigner.config import PARALLEL_TOPOLOGY_MIN_EDGES
 from capassigner.core.metrics import Solution, ProgressUpdate, ProgressCallback, create_solution, rank_solutions
 from capassigner.core.graphs import GraphTopology
 
@@ -43,18 +48,18 @@ def solve(
     for G_template in topologies:
         nodes = list(G_template.nodes())
         edges = list(G_template.edges(keys=True)) # (u, v, key)
+        structure = tuple((u, v) for u, v, _ in edges)
         
         # Iterate all pairs of terminals
         for term_a, term_b in combinations(nodes, 2):
+            # Reducibility does not depend on the values, so terminal pairs
+            # that cannot reduce skip all capacitor permutations
+            if not _is_structurally_reducible(structure, term_a, term_b):
+                continue
             
             # Iterate all permutations of capacitors
             for cap_perm in permutations(capacitors):
-                # Assign capacitors to edges
-                G = G_template.copy()
-                for i, (u, v, k) in enumerate(edges):
-                    G[u][v][k]['capacitance'] = cap_perm[i]
-                
-                ceq = is_sp_reducible(G, term_a, term_b)
+                ceq = _reduce(nodes, zip(structure, cap_perm), term_a, term_b)
                 
                 if ceq is not None:
                     # Deduplicate by value (approximate)
@@ -62,6 +67,11 @@ def solve(
                         continue
                     seen_values.add(ceq)
                     
+                    # Assign capacitors to edges
+                    G = G_template.copy()
+                    for i, (u, v, k) in enumerate(edges):
+                        G[u][v][k]['capacitance'] = cap_perm[i]
+                    
                     # Create internal nodes list
                     internal = [n for n in nodes if n != term_a and n != term_b]
                     
@@ -90,6 +100,88 @@ def solve(
             
     return rank_solutions(solutions)[:max_results]
 
+def _compositions(total: int, bins: int) -> Iterator[Tuple[int, ...]]:
+    """
+    Yields every way of distributing total edges across bins pair slots.
+    
+    Vectors are produced with the largest leading multiplicities first,
+    matching the order of combinations_with_replacement over the pairs.
+    """
+    if bins == 1:
+        yield (total,)
+        return
+    for k in range(total, -1, -1):
+        for rest in _compositions(total - k, bins - 1):
+            yield (k,) + rest
+
+def _multiplicity_graph(nodes: range, pairs: Sequence[Tuple[int, int]], mult: Tuple[int, ...]) -> nx.Graph:
+    """
+    Builds the simple graph of occupied pairs, each edge labelled with its
+    multiplicity ('mult').
+    """
+    H = nx.Graph()
+    H.add_nodes_from(nodes)
+    H.add_edges_from((u, v, {'mult': k}) for (u, v), k in zip(pairs, mult) if k)
+    return H
+
+def _is_connected(num_nodes: int, pairs: Sequence[Tuple[int, int]], mult: Tuple[int, ...]) -> bool:
+    """
+    Checks connectivity of the occupied pairs with a disjoint-set union,
+    without building a graph.
+    """
+    parent = list(range(num_nodes))
+    
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    
+    components = num_nodes
+    for (u, v), k in zip(pairs, mult):
+        if k:
+            ru, rv = find(u), find(v)
+            if ru != rv:
+                parent[ru] = rv
+                components -= 1
+                if components == 1:
+                    return True
+    return components == 1
+
+def _same_mult(e1: dict, e2: dict) -> bool:
+    return e1['mult'] == e2['mult']
+
+# A connected edge-multiplicity vector over the pairs of range(v): (v, mult)
+Candidate = Tuple[int, Tuple[int, ...]]
+
+@lru_cache(maxsize=None)
+def _node_pairs(num_nodes: int) -> Tuple[Tuple[int, int], ...]:
+    """All possible pairs of nodes (potential edge locations)."""
+    return tuple(combinations(range(num_nodes), 2))
+
+def _candidate_graph(candidate: Candidate) -> nx.Graph:
+    v, mult = candidate
+    return _multiplicity_graph(range(v), _node_pairs(v), mult)
+
+def _candidate_hash(candidate: Candidate) -> str:
+    """WL hash of a candidate; runs in pool workers for large sweeps."""
+    return nx.weisfeiler_lehman_graph_hash(_candidate_graph(candidate), edge_attr='mult')
+
+def _first_of_each_class(bucket: List[Tuple[int, Candidate]]) -> List[int]:
+    """
+    Indices of the candidates in one hash bucket (in enumeration order) that
+    are not isomorphic to an earlier candidate of the bucket.
+    """
+    kept_graphs: List[nx.Graph] = []
+    kept = []
+    for index, candidate in bucket:
+        H = _candidate_graph(candidate)
+        if any(nx.is_isomorphic(H, existing, edge_match=_same_mult) for existing in kept_graphs):
+            continue
+        kept_graphs.append(H)
+        kept.append(index)
+    return kept
+
 def generate_topologies(num_edges: int) -> List[nx.MultiGraph]:
     """
     Generates all unique connected multigraphs with num_edges.
@@ -97,32 +189,76 @@ def generate_topologies(num_edges: int) -> List[nx.MultiGraph]:
     Iterates through possible number of nodes V from 2 to num_edges + 1.
     Generates all multigraphs with num_edges on V nodes.
     Filters for connectivity and isomorphism.
+    
+    From PARALLEL_TOPOLOGY_MIN_EDGES edges on, hashing and the per-bucket
+    isomorphism checks are spread over a process pool. Buckets are
+    independent and each keeps its first candidate per class, so the result
+    (and its order) is the same as the sequential sweep.
     """
+    candidates = _connected_candidates(num_edges)
+    
+    workers = os.cpu_count() or 1
+    if num_edges >= PARALLEL_TOPOLOGY_MIN_EDGES and workers > 1:
+        # spawn: forking the (threaded) Streamlit server is not safe
+        with get_context("spawn").Pool(workers) as pool:
+            kept = _unique_candidates(candidates, pool.map)
+    else:
+        kept = _unique_candidates(candidates, map)
+    
     topologies = []
+    for v, mult in kept:
+        G = nx.MultiGraph()
+        G.add_nodes_from(range(v))
+        G.add_edges_from(pair for pair, k in zip(_node_pairs(v), mult) for _ in range(k))
+        topologies.append(G)
+    return topologies
+
+def _connected_candidates(num_edges: int) -> List[Candidate]:
+    """
+    All connected (node count, edge multiplicities) pairs with num_edges edges.
+    
+    Not yet reduced to one per isomorphism class; see _unique_candidates.
+    """
+    candidates: List[Candidate] = []
     # Iterate over possible number of nodes V
     # Minimum 2 nodes (A, B), maximum num_edges + 1 (linear chain)
     for v in range(2, num_edges + 2):
-        nodes = range(v)
-        # All possible pairs of nodes (potential edge locations)
-        possible_pairs = list(combinations(nodes, 2))
+        possible_pairs = _node_pairs(v)
         
-        # Distribute num_edges into these pairs (multigraph allowed)
-        # combinations_with_replacement allows multiple edges between same pair
-        for edges in combinations_with_replacement(possible_pairs, num_edges):
-            G = nx.MultiGraph()
-            G.add_nodes_from(nodes)
-            G.add_edges_from(edges)
-            
-            if not nx.is_connected(G):
-                continue
-                
-            # Check isomorphism against found topologies
-            # Note: For larger N, this is slow. But for N<=6 it's acceptable.
-            if any(nx.is_isomorphic(G, existing) for existing in topologies):
+        # Distribute num_edges into these pairs (multigraph allowed): each
+        # composition is an edge-multiplicity vector over possible_pairs
+        for mult in _compositions(num_edges, len(possible_pairs)):
+            # A connected graph on v nodes occupies at least v - 1 pairs
+            if sum(1 for k in mult if k) < v - 1:
                 continue
-                
-            topologies.append(G)
-    return topologies
+            if _is_connected(v, possible_pairs, mult):
+                candidates.append((v, mult))
+    return candidates
+
+def _unique_candidates(candidates: List[Candidate], mapper: Callable) -> List[Candidate]:
+    """
+    One candidate per isomorphism class, in enumeration order.
+    
+    Candidates are bucketed by WL hash; VF2 only runs within a bucket.
+    mapper is map or Pool.map.
+    """
+    buckets: Dict[str, List[Tuple[int, Candidate]]] = {}
+    for index, (h, candidate) in enumerate(zip(mapper(_candidate_hash, candidates), candidates)):
+        buckets.setdefault(h, []).append((index, candidate))
+    kept = sorted(i for indices in mapper(_first_of_each_class, list(buckets.values())) for i in indices)
+    return [candidates[i] for i in kept]
+
+@lru_cache(maxsize=None)
+def _is_structurally_reducible(edges: Tuple[Tuple[Any, Any], ...], term_a: Any, term_b: Any) -> bool:
+    """
+    Whether the multigraph with these edges reduces to a single A-B edge.
+    
+    The reduction steps only look at the structure (degrees, multiplicities),
+    so the verdict is computed once with unit capacitances and cached by the
+    exact edge list for every later capacitor assignment.
+    """
+    nodes = {n for edge in edges for n in edge}
+    return _reduce(nodes, ((edge, 1.0) for edge in edges), term_a, term_b) is not None
 
 def is_sp_reducible(graph: nx.MultiGraph, term_a: Any, term_b: Any) -> Optional[float]:
     """
@@ -132,87 +268,77 @@ def is_sp_reducible(graph: nx.MultiGraph, term_a: Any, term_b: Any) -> Optional[
     Returns equivalent capacitance if graph reduces to a single edge between terminals.
     Returns None if irreducible or disconnected.
     """
-    # Work on a copy to avoid modifying the original
-    G = graph.copy()
+    edges = (((u, v), c) for u, v, c in graph.edges(data='capacitance'))
+    return _reduce(graph.nodes(), edges, term_a, term_b)
+
+def _reduce(nodes: Iterable[Any], edges: Iterable[Tuple[Tuple[Any, Any], float]],
+            term_a: Any, term_b: Any) -> Optional[float]:
+    """
+    Series-parallel reduction on plain dicts (the graph is never mutated).
     
-    changed = True
-    while changed:
-        changed = False
-        
-        # 1. Parallel Reduction
-        # Identify edges (u, v) with multiplicity > 1
-        parallel_reductions = []
-        # Iterate over edges to find parallel bundles
-        # We use set of pairs to avoid duplicates
-        processed_pairs = set()
-        
-        for u in list(G.nodes()):
-            for v in list(G.neighbors(u)):
-                pair = tuple(sorted((u, v)))
-                if pair in processed_pairs:
-                    continue
-                processed_pairs.add(pair)
-                
-                if G.number_of_edges(u, v) > 1:
-                    # Found parallel edges
-                    total_cap = 0.0
-                    for key in G[u][v]:
-                        total_cap += G[u][v][key]['capacitance']
-                    parallel_reductions.append((u, v, total_cap))
+    Edges are ((u, v), capacitance) items. Parallel bundles are merged into
+    a single capacitance per node pair, so the working graph is a weighted
+    simple graph: caps maps frozenset({u, v}) to capacitance and adj maps
+    each node to its neighbour set (a self-loop lists the node itself).
+    """
+    adj: Dict[Any, set] = {n: set() for n in nodes}
+    caps: Dict[frozenset, float] = {}
+    
+    # 1. Parallel Reduction
+    # Accumulate every bundle into one combined capacitance per pair
+    for (u, v), c in edges:
+        pair = frozenset((u, v))
+        caps[pair] = caps[pair] + c if pair in caps else c
+        adj[u].add(v)
+        adj[v].add(u)
+    
+    terminals = (term_a, term_b)
+    
+    def degree(n: Any) -> int:
+        # Multigraph degree after merging: a self-loop counts twice
+        return len(adj[n]) + (n in adj[n])
+    
+    # 2. Series Reduction
+    # Contract degree-2 non-terminal nodes from a worklist. A contraction
+    # only changes its two neighbours, so only they are re-checked: a new
+    # parallel bundle between them is merged on the spot, and a neighbour
+    # whose degree drops to 2 is queued.
+    worklist = deque(n for n in adj if n not in terminals and degree(n) == 2)
+    while worklist:
+        series_node = worklist.popleft()
+        if series_node not in adj or degree(series_node) != 2:
+            continue
         
-        for u, v, total_cap in parallel_reductions:
-            # Remove all edges between u, v
-            keys = list(G[u][v].keys())
-            for k in keys:
-                G.remove_edge(u, v, key=k)
-            # Add single combined edge
-            G.add_edge(u, v, capacitance=total_cap)
-            changed = True
+        neighbors = adj.pop(series_node)
+        # Handle standard series case: u -- n -- v where u != v
+        if len(neighbors) == 2:
+            u, v = neighbors
+            c1 = caps.pop(frozenset((u, series_node)))
+            c2 = caps.pop(frozenset((series_node, v)))
             
-        if changed: continue # Restart loop if modified
-        
-        # 2. Series Reduction
-        # Find degree-2 nodes that are not terminals
-        series_node = None
-        for n in list(G.nodes()):
-            if n == term_a or n == term_b:
-                continue
-            if G.degree(n) == 2:
-                series_node = n
-                break
+            c_new = 1.0 / (1.0/c1 + 1.0/c2)
+            
+            adj[u].discard(series_node)
+            adj[v].discard(series_node)
+            pair = frozenset((u, v))
+            if pair in caps:
+                caps[pair] += c_new
+            else:
+                caps[pair] = c_new
+                adj[u].add(v)
+                adj[v].add(u)
+        else:
+            # n -- n self-loop: it does not affect C_eq between A and B,
+            # so drop the node
+            caps.pop(frozenset((series_node,)))
+            neighbors = ()
         
-        if series_node is not None:
-            neighbors = list(G.neighbors(series_node))
-            # Handle standard series case: u -- n -- v where u != v
-            if len(set(neighbors)) == 2:
-                u, v = neighbors
-                # Get capacitances (assume single edge after parallel reduction)
-                # Note: G[u][n] is a dict of edges. We take the first one (key 0 usually)
-                # But keys might not be 0 if edges were added/removed.
-                # Use list(G[u][n].values())[0]
-                c1 = list(G[u][series_node].values())[0]['capacitance']
-                c2 = list(G[series_node][v].values())[0]['capacitance']
-                
-                c_new = 1.0 / (1.0/c1 + 1.0/c2)
-                
-                G.remove_node(series_node)
-                G.add_edge(u, v, capacitance=c_new)
-                changed = True
-            elif len(set(neighbors)) == 1:
-                # u -- n -- u (hanging loop). Remove it?
-                # A hanging loop doesn't affect C_eq between A and B unless it's the only path?
-                # If it's a dead end, we can remove it.
-                # But strictly, series reduction applies to 2 distinct neighbors.
-                # If we have a dead end, it's not series in the flow sense.
-                # We can prune dead ends (degree 1) but degree 2 loop is weird.
-                # Let's ignore for now, or remove node if it's not terminal.
-                # If we remove it, we break the loop.
-                G.remove_node(series_node)
-                changed = True
+        for m in neighbors:
+            if m not in terminals and degree(m) == 2:
+                worklist.append(m)
                 
     # Check result
-    if G.number_of_nodes() == 2 and G.number_of_edges() == 1:
-        if G.has_edge(term_a, term_b):
-             return list(G[term_a][term_b].values())[0]['capacitance']
+    if len(adj) == 2 and len(caps) == 1:
+        return caps.get(frozenset(terminals))
     
     return None
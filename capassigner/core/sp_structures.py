@@ -9,7 +9,7 @@ Constitutional Compliance:
 """
 
 from __future__ import annotations
-from typing import Callable, List, Union, Optional
+from typing import Any, Callable, ClassVar, Dict, List, Tuple, Union, Optional
 from dataclasses import dataclass
 
 
@@ -32,20 +32,43 @@ class Capacitor:
             raise ValueError(f"Capacitance must be positive, got {self.value}")
 
 
+# SP nodes declare __slots__ by hand (dataclass(slots=True) needs Python 3.10)
+# so the many instances built during enumeration carry no per-instance __dict__.
+
+class _SlottedNode:
+    """Base for the slotted, frozen SP node dataclasses.
+
+    Frozen dataclasses reject the setattr that pickle and copy use to restore
+    slot state, so state is saved and restored here explicitly.
+    """
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
 @dataclass(frozen=True)
-class Leaf:
+class Leaf(_SlottedNode):
     """Leaf node representing a single capacitor in SP tree.
 
     Attributes:
         capacitor_index: Index into capacitor inventory.
         value: Capacitance value in Farads (cached for performance).
+        KIND: Class-level node tag (0 = Leaf) for cheap type dispatch.
     """
+    __slots__ = ("capacitor_index", "value")
+    KIND: ClassVar[int] = 0
+
     capacitor_index: int
     value: float
 
 
 @dataclass(frozen=True)
-class Series:
+class Series(_SlottedNode):
     """Series connection of two SP networks.
 
     Formula: C_series = 1 / (1/C_left + 1/C_right)
@@ -53,13 +76,17 @@ class Series:
     Attributes:
         left: Left sub-topology.
         right: Right sub-topology.
+        KIND: Class-level node tag (1 = Series) for cheap type dispatch.
     """
+    __slots__ = ("left", "right")
+    KIND: ClassVar[int] = 1
+
     left: 'SPNode'
     right: 'SPNode'
 
 
 @dataclass(frozen=True)
-class Parallel:
+class Parallel(_SlottedNode):
     """Parallel connection of two SP networks.
 
     Formula: C_parallel = C_left + C_right
@@ -67,7 +94,11 @@ class Parallel:
     Attributes:
         left: Left sub-topology.
         right: Right sub-topology.
+        KIND: Class-level node tag (2 = Parallel) for cheap type dispatch.
     """
+    __slots__ = ("left", "right")
+    KIND: ClassVar[int] = 2
+
     left: 'SPNode'
     right: 'SPNode'
 
@@ -222,3 +253,48 @@ def sp_node_to_normalized_expression(node: SPNode, capacitor_labels: List[str])
         return "(" + "||".join(operands) + ")"
     else:
         raise TypeError(f"Unknown SPNode type: {type(node)}")
+
+
+def sp_nodes_to_normalized_expressions(
+    nodes: List[SPNode],
+    capacitor_labels: List[str]
+) -> List[str]:
+    """Normalize many SP trees at once, sharing work across common subtrees.
+
+    Gives the same strings as calling ``sp_node_to_normalized_expression`` on
+    each node. Enumerated topologies share subtree objects, so operands and
+    normalized forms are memoized by ``id(node)`` for the duration of the
+    call (``nodes`` keeps every subtree alive).
+
+    Args:
+        nodes: SP trees to normalize.
+        capacitor_labels: Labels for capacitors (e.g., ["C1", "C2", "C3"]).
+
+    Returns:
+        Normalized expression strings, aligned with ``nodes``.
+    """
+    # id(node) -> (normalized expression, unsorted operands of the node's own type)
+    memo: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+
+    def _normalize(node: SPNode) -> Tuple[str, Tuple[str, ...]]:
+        cached = memo.get(id(node))
+        if cached is not None:
+            return cached
+        if isinstance(node, Leaf):
+            label = capacitor_labels[node.capacitor_index]
+            result = (label, (label,))
+        elif isinstance(node, (Series, Parallel)):
+            op_type = type(node)
+            operands = _operands(node.left, op_type) + _operands(node.right, op_type)
+            separator = "+" if op_type is Series else "||"
+            result = ("(" + separator.join(sorted(operands)) + ")", operands)
+        else:
+            raise TypeError(f"Unknown SPNode type: {type(node)}")
+        memo[id(node)] = result
+        return result
+
+    def _operands(node: SPNode, op_type: type) -> Tuple[str, ...]:
+        normalized, operands = _normalize(node)
+        return operands if isinstance(node, op_type) else (normalized,)
+
+    return [_normalize(node)[0] for node in nodes]
@@ -11,9 +11,59 @@ Constitutional Compliance:
 """
 
 from __future__ import annotations
+from functools import lru_cache
+import threading
+from types import ModuleType
 import streamlit as st
-from typing import List, Optional
-import pandas as pd
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+_pd: Optional[ModuleType] = None
+
+
+def _pandas() -> ModuleType:
+    """Return the pandas module, importing it on first use.
+
+    pandas is only needed for result and comparison tables, so the import
+    cost is paid the first time one is rendered rather than at page load.
+    """
+    global _pd
+    if _pd is None:
+        import pandas
+        _pd = pandas
+    return _pd
+
+
+def _prewarm() -> None:
+    """Pay first-use costs of the table and plotting stack off the main thread.
+
+    Imports pandas and draws a throwaway figure with regular and mathtext
+    labels, so font, glyph and mathtext parser caches are warm before the
+    first result table or circuit plot is rendered. Uses the object-oriented
+    Agg API only; pyplot state is not touched from this thread.
+    """
+    try:
+        _pandas()
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(1, 1))
+        fig.text(0.5, 0.5, "C1 $x$")
+        FigureCanvasAgg(fig).draw()
+    except Exception:
+        # Warming is best effort; the real render reports its own errors
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def _start_prewarm() -> threading.Thread:
+    """Start the prewarm thread once per server process."""
+    thread = threading.Thread(target=_prewarm, name="capassigner-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 def _rerun() -> None:
@@ -51,6 +101,7 @@ from capassigner.ui.theory import (
     show_graph_theory,
     show_heuristic_theory,
     show_method_comparison,
+    show_formulas,
     get_sp_theory_content,
     get_laplacian_theory_content,
     get_heuristic_theory_content,
@@ -106,6 +157,18 @@ The E96 series contains **96 values per decade** and is used for high-precision
 }
 
 
+@lru_cache(maxsize=1)
+def _comparison_df() -> pd.DataFrame:
+    """Method comparison table for the Theory page.
+
+    Built on the first Theory page render and reused afterwards; the table is
+    static and st.dataframe only reads it.
+    """
+    pd = _pandas()
+    content = get_method_comparison_content()
+    return pd.DataFrame.from_records(content.comparison_rows, columns=content.comparison_header)
+
+
 def _initialize_session_state() -> None:
     """Initialize session state with default values (T090, T095, T098).
 
@@ -164,6 +227,7 @@ def render_main_page() -> None:
     """
     # Initialize session state
     _initialize_session_state()
+    _start_prewarm()
 
     # Sidebar navigation menu
     with st.sidebar:
@@ -213,79 +277,80 @@ def _render_theory_page() -> None:
     
     # SP Theory Section
     st.header("1. Series-Parallel Networks")
-    content = get_sp_theory_content()
-    st.markdown(content['explanation'])
+    c = get_sp_theory_content()
+    explanation, formulas, when_to_use, complexity = (
+        c.explanation, c.formulas, c.when_to_use, c.complexity)
+    st.markdown(explanation)
     
     st.subheader("Key Formulas")
-    for latex, description in content['formulas']:
-        st.latex(latex)
-        st.caption(description)
+    show_formulas(formulas)
     
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("When to Use")
-        st.markdown(content['when_to_use'])
+        st.markdown(when_to_use)
     with col2:
         st.subheader("Complexity")
-        st.markdown(content['complexity'])
+        st.markdown(complexity)
     
     st.markdown("---")
     
     # Laplacian Theory Section
     st.header("2. Laplacian Nodal Analysis")
-    content = get_laplacian_theory_content()
-    st.markdown(content['explanation'])
+    c = get_laplacian_theory_content()
+    explanation, formulas, when_to_use, complexity = (
+        c.explanation, c.formulas, c.when_to_use, c.complexity)
+    st.markdown(explanation)
     
     st.subheader("Key Formulas")
-    for latex, description in content['formulas']:
-        st.latex(latex)
-        st.caption(description)
+    show_formulas(formulas)
     
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("When to Use")
-        st.markdown(content['when_to_use'])
+        st.markdown(when_to_use)
     with col2:
         st.subheader("Complexity")
-        st.markdown(content['complexity'])
+        st.markdown(complexity)
     
     st.markdown("---")
     
     # Heuristic Theory Section
     st.header("3. Heuristic Graph Search")
-    content = get_heuristic_theory_content()
-    st.markdown(content['explanation'])
+    c = get_heuristic_theory_content()
+    explanation, formulas, when_to_use, complexity = (
+        c.explanation, c.formulas, c.when_to_use, c.complexity)
+    st.markdown(explanation)
     
     st.subheader("Key Formulas")
-    for latex, description in content['formulas']:
-        st.latex(latex)
-        st.caption(description)
+    show_formulas(formulas)
     
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("When to Use")
-        st.markdown(content['when_to_use'])
+        st.markdown(when_to_use)
     with col2:
         st.subheader("Complexity")
-        st.markdown(content['complexity'])
+        st.markdown(complexity)
     
     st.markdown("---")
     
     # Method Comparison Section
     st.header("4. Method Comparison")
-    content = get_method_comparison_content()
+    c = get_method_comparison_content()
+    recommendations, complexity_comparison = (
+        c.recommendations, c.complexity_comparison)
     
     # Display comparison table
-    df = pd.DataFrame(content['comparison_table'])
-    st.dataframe(df, width='stretch', hide_index=True)
+    st.dataframe(_comparison_df(), width='stretch', hide_index=True)
     
     # Display recommendations
     st.subheader("Choosing the Right Method")
-    st.markdown(content['recommendations'])
+    st.markdown(recommendations)
     
     # Display complexity comparison
     st.subheader("Complexity Comparison")
-    st.markdown(content['complexity_comparison'])
+    st.markdown(complexity_comparison)
 
 
 def _render_calculator_page() -> None:
@@ -817,7 +882,7 @@ def _display_results(
             "Within Tolerance": "✓" if sol.within_tolerance else "✗"
         })
 
-    df = pd.DataFrame(results_data)
+    df = _pandas().DataFrame(results_data)
 
     # Display table
     st.dataframe(
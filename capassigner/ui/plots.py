@@ -10,10 +10,15 @@ Constitutional Compliance:
 
 from __future__ import annotations
 import logging
+import math
+import re
+from functools import lru_cache
 import matplotlib.pyplot as plt
-from typing import Any, Dict, List, Tuple, Optional
+from matplotlib.collections import LineCollection
+from typing import Any, Dict, Iterator, List, Tuple, Optional
 
 import networkx as nx
+import numpy as np
 
 # Check for lcapy availability (professional circuit rendering)
 try:
@@ -40,6 +45,50 @@ logger = logging.getLogger(__name__)
 # Color constants for better visibility
 LABEL_COLOR = '#CC0000'  # Red color for capacitor labels
 TERMINAL_COLOR = '#CC0000'  # Red for terminal labels
+WIRE_COLOR = '#2C3E50'  # Dark blue-gray for wires and capacitor plates
+
+# Capacitor symbol geometry (matplotlib fallback renderer)
+PLATE_WIDTH = 0.08  # Half-width of a capacitor plate
+PLATE_GAP = 0.06    # Distance from edge midpoint to each plate
+LABEL_OFFSET = 0.15  # Perpendicular offset of the capacitance label
+SEGMENTS_PER_CAPACITOR = 4  # wire1, wire2, plate1, plate2
+CURVE_OFFSET = 0.3  # Control point offset per parallel edge index
+BEZIER_SAMPLES = 32  # Points used to approximate each curved wire
+RASTERIZE_SEGMENT_THRESHOLD = 500  # Wire collections larger than this are rasterized
+FIGURE_DPI = 100  # Fixed DPI so backends do not recompute their default
+
+# Quadratic Bernstein basis sampled at BEZIER_SAMPLES parameters, shape (T, 3)
+_BEZIER_T = np.linspace(0.0, 1.0, BEZIER_SAMPLES)
+_QUADRATIC_BERNSTEIN = np.column_stack(
+    ((1 - _BEZIER_T) ** 2, 2 * (1 - _BEZIER_T) * _BEZIER_T, _BEZIER_T ** 2)
+)
+
+
+class _PlotContext:
+    """Reusable matplotlib Figure/Axes pair for batch rendering.
+
+    Creating a Figure (canvas allocation, font lookups) dominates the cost of
+    small plots. Renderers that accept a ``ctx`` clear and redraw this single
+    Axes instead. A context is not thread-safe; use one per worker.
+
+    Example:
+        >>> ctx = _PlotContext()
+        >>> for topology in topologies:
+        ...     _render_graph_as_circuit_matplotlib(topology, ctx=ctx).savefig(path)
+        >>> ctx.close()
+    """
+
+    def __init__(self, figsize: Tuple[float, float] = (12, 8)) -> None:
+        self.fig, self.ax = plt.subplots(figsize=figsize, dpi=FIGURE_DPI)
+
+    def reset(self) -> plt.Axes:
+        """Clear the shared Axes and return it for the next render."""
+        self.ax.clear()
+        return self.ax
+
+    def close(self) -> None:
+        """Release the underlying figure."""
+        plt.close(self.fig)
 
 
 def render_sp_circuit(
@@ -700,16 +749,28 @@ def _render_graph_as_circuit_schemdraw(
 def _render_graph_as_circuit_matplotlib(
     topology: GraphTopology,
     scale: float = 1.0,
-    font_size: int = 10
+    font_size: int = 10,
+    ctx: Optional[_PlotContext] = None
 ) -> plt.Figure:
     """Render graph topology as circuit schematic using matplotlib.
     
     Creates a clean circuit-like diagram with capacitor symbols on edges.
+
+    Args:
+        topology: GraphTopology with graph, terminals, and internal nodes.
+        scale: Scaling factor for the diagram layout.
+        font_size: Font size for labels.
+        ctx: Optional reusable figure context for batch rendering. When given,
+            its axes are cleared and redrawn instead of creating a new figure.
     """
     graph = topology.graph
     
-    # Create figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Create figure (or reuse the batch context's figure)
+    if ctx is not None:
+        fig, ax = ctx.fig, ctx.reset()
+    else:
+        fig, ax = plt.subplots(figsize=(12, 8))
+        fig.set_dpi(FIGURE_DPI)
     
     # Create custom layout: terminals on sides, internal nodes in middle
     pos = {}
@@ -729,40 +790,64 @@ def _render_graph_as_circuit_matplotlib(
     # Handle both MultiGraph (with keys) and regular Graph (without keys)
     edge_count = {}  # Track how many edges between each pair for offset
     is_multigraph = isinstance(graph, nx.MultiGraph)
-    
-    if is_multigraph:
-        # MultiGraph: iterate with keys to get all parallel edges
-        for u, v, key, data in graph.edges(data=True, keys=True):
-            cap = data.get('capacitance', 0)
-            cap_label = _format_capacitance(cap)
-            
-            x1, y1 = pos[u]
-            x2, y2 = pos[v]
-            
-            # Calculate offset for parallel edges
-            pair = tuple(sorted([u, v]))
-            edge_num = edge_count.get(pair, 0)
-            edge_count[pair] = edge_num + 1
-            
-            # Draw wire segments with capacitor symbol in middle
-            _draw_capacitor_symbol(ax, x1, y1, x2, y2, cap_label, font_size, edge_num)
-    else:
-        # Regular Graph: no keys parameter
-        for u, v, data in graph.edges(data=True):
-            cap = data.get('capacitance', 0)
-            cap_label = _format_capacitance(cap)
-            
-            x1, y1 = pos[u]
-            x2, y2 = pos[v]
-            
-            # Calculate offset for parallel edges (shouldn't happen in regular Graph)
-            pair = tuple(sorted([u, v]))
-            edge_num = edge_count.get(pair, 0)
-            edge_count[pair] = edge_num + 1
-            
-            # Draw wire segments with capacitor symbol in middle
-            _draw_capacitor_symbol(ax, x1, y1, x2, y2, cap_label, font_size, edge_num)
-    
+    edge_iter = (
+        ((u, v, data) for u, v, key, data in graph.edges(data=True, keys=True))
+        if is_multigraph else graph.edges(data=True)
+    )
+
+    # Straight edges are batched into a single LineCollection; curved
+    # (parallel) edges are grouped per endpoint pair and sampled together.
+    straight_coords = []
+    straight_labels = []
+    curved_groups: Dict[Tuple[Any, Any], Tuple[Tuple[float, float, float, float], List[int], List[str]]] = {}
+    for u, v, data in edge_iter:
+        cap = data.get('capacitance', 0)
+        cap_label = _format_capacitance(cap)
+
+        x1, y1 = pos[u]
+        x2, y2 = pos[v]
+
+        # Calculate offset for parallel edges
+        pair = tuple(sorted([u, v]))
+        edge_num = edge_count.get(pair, 0)
+        edge_count[pair] = edge_num + 1
+
+        if edge_num > 0:
+            group = curved_groups.setdefault(pair, ((x1, y1, x2, y2), [], []))
+            group[1].append(edge_num)
+            group[2].append(cap_label)
+        elif np.hypot(x2 - x1, y2 - y1) >= 0.01:
+            straight_coords.append((x1, y1, x2, y2))
+            straight_labels.append(cap_label)
+
+    if straight_coords:
+        coords = np.asarray(straight_coords, dtype=np.float64)
+        segments = _compute_capacitor_segments_batch(coords)
+        # Wires are thinner than plates: (2, 2, 3, 3) per capacitor
+        linewidths = np.tile([2, 2, 3, 3], len(coords))
+        ax.add_collection(_wire_collection(segments, linewidths=linewidths, zorder=2))
+        mid, _, perpendicular = _edge_frames(coords)
+        label_positions = mid + perpendicular * LABEL_OFFSET
+        for (label_x, label_y), cap_label in zip(label_positions, straight_labels):
+            _draw_capacitor_label(ax, label_x, label_y, cap_label, font_size)
+
+    curves, plates = [], []
+    for coords, edge_nums, cap_labels in curved_groups.values():
+        if math.hypot(coords[2] - coords[0], coords[3] - coords[1]) < 0.01:
+            continue
+        group_curves, ctrl, perpendicular = _compute_parallel_edge_curves(
+            np.asarray(coords, dtype=np.float64), np.asarray(edge_nums)
+        )
+        curves.append(group_curves)
+        plate_offset = perpendicular * PLATE_WIDTH
+        plates.append(np.stack((ctrl - plate_offset, ctrl + plate_offset), axis=1))
+        for (mx, my), cap_label in zip(ctrl + perpendicular * LABEL_OFFSET, cap_labels):
+            _draw_capacitor_label(ax, mx, my, cap_label, font_size)
+
+    if curves:
+        ax.add_collection(_wire_collection(np.concatenate(curves), linewidths=2, zorder=1))
+        ax.add_collection(_wire_collection(np.concatenate(plates), linewidths=3, zorder=2))
+
     # Draw nodes as dots
     for node in graph.nodes():
         x, y = pos[node]
@@ -811,123 +896,125 @@ def _render_graph_as_circuit_matplotlib(
     ax.set_ylim(ylim[0] - margin, ylim[1] + margin)
     ax.axis('off')
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
-def _draw_capacitor_symbol(
-    ax: plt.Axes,
+def _compute_capacitor_segments(
     x1: float, y1: float,
-    x2: float, y2: float,
-    label: str,
-    font_size: int = 10,
-    edge_num: int = 0
-) -> None:
-    """Draw a capacitor symbol between two points.
-    
-    Draws connecting wires and a capacitor symbol (two parallel lines) in the middle.
-    For parallel edges (edge_num > 0), draws curved path.
-    
+    x2: float, y2: float
+) -> np.ndarray:
+    """Compute the line segments of a straight capacitor symbol.
+
+    The symbol consists of two wires running from each endpoint towards the
+    edge midpoint and two plates perpendicular to the edge.
+
     Args:
-        edge_num: Index for parallel edges (0 for first, 1 for second, etc.) to offset them
+        x1, y1: Start point of the edge.
+        x2, y2: End point of the edge (must differ from the start point).
+
+    Returns:
+        Array of shape (4, 2, 2) holding the segments wire1, wire2, plate1, plate2.
     """
-    import numpy as np
-    from matplotlib.patches import FancyBboxPatch, Arc
-    from matplotlib.path import Path
-    import matplotlib.patches as mpatches
-    
-    # Calculate direction and perpendicular
-    dx = x2 - x1
-    dy = y2 - y1
-    length = np.sqrt(dx**2 + dy**2)
-    
-    if length < 0.01:
-        return
-    
-    # Unit vectors
-    ux, uy = dx / length, dy / length  # Direction along edge
-    px, py = -uy, ux  # Perpendicular
-    
-    # Capacitor plate dimensions
-    plate_width = 0.08  # Width of capacitor plate
-    plate_gap = 0.06    # Gap between plates
-    
-    # For parallel edges, use curved path
-    if edge_num > 0:
-        # Calculate arc control point (offset perpendicular to edge)
-        curve_offset = 0.3 * edge_num  # How much to curve
-        mid_x = (x1 + x2) / 2
-        mid_y = (y1 + y2) / 2
-        ctrl_x = mid_x + px * curve_offset
-        ctrl_y = mid_y + py * curve_offset
-        
-        # Create curved path using quadratic Bezier
-        verts = [
-            (x1, y1),
-            (ctrl_x, ctrl_y),
-            (x2, y2)
-        ]
-        codes = [Path.MOVETO, Path.CURVE3, Path.CURVE3]
-        path = Path(verts, codes)
-        
-        # Draw curved wire
-        patch = mpatches.PathPatch(path, facecolor='none', edgecolor='#2C3E50', 
-                                   linewidth=2, zorder=1)
-        ax.add_patch(patch)
-        
-        # Draw capacitor symbol at curve midpoint
-        # Use control point as capacitor location
-        mx, my = ctrl_x, ctrl_y
-        
-        # Draw capacitor plates perpendicular to curve at midpoint
-        plate1_x = [mx - px * plate_width, mx + px * plate_width]
-        plate1_y = [my - py * plate_width, my + py * plate_width]
-        ax.plot(plate1_x, plate1_y, color='#2C3E50', linewidth=3, zorder=2)
-        
-        # Add label
-        label_offset = 0.15
-        label_x = mx + px * label_offset
-        label_y = my + py * label_offset
-        
-        ax.text(label_x, label_y, label, ha='center', va='center',
-                fontsize=font_size, fontweight='bold', color=LABEL_COLOR,
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
-                         edgecolor=LABEL_COLOR, alpha=0.95),
-                zorder=5)
-        return
-    
-    # Midpoint
-    mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-    
-    # Draw wire from point 1 to first plate
-    wire1_end_x = mx - ux * plate_gap
-    wire1_end_y = my - uy * plate_gap
-    ax.plot([x1, wire1_end_x], [y1, wire1_end_y], 
-            color='#2C3E50', linewidth=2, zorder=1)
-    
-    # Draw wire from second plate to point 2
-    wire2_start_x = mx + ux * plate_gap
-    wire2_start_y = my + uy * plate_gap
-    ax.plot([wire2_start_x, x2], [wire2_start_y, y2], 
-            color='#2C3E50', linewidth=2, zorder=1)
-    
-    # Draw first capacitor plate (perpendicular to edge)
-    plate1_x = [wire1_end_x - px * plate_width, wire1_end_x + px * plate_width]
-    plate1_y = [wire1_end_y - py * plate_width, wire1_end_y + py * plate_width]
-    ax.plot(plate1_x, plate1_y, color='#2C3E50', linewidth=3, zorder=2)
-    
-    # Draw second capacitor plate
-    plate2_x = [wire2_start_x - px * plate_width, wire2_start_x + px * plate_width]
-    plate2_y = [wire2_start_y - py * plate_width, wire2_start_y + py * plate_width]
-    ax.plot(plate2_x, plate2_y, color='#2C3E50', linewidth=3, zorder=2)
-    
-    # Add capacitance label with white background
-    # Position label slightly offset from the capacitor
-    label_offset = 0.15
-    label_x = mx + px * label_offset
-    label_y = my + py * label_offset
-    
-    ax.text(label_x, label_y, label, ha='center', va='center',
+    return _compute_capacitor_segments_batch(np.array([[x1, y1, x2, y2]], dtype=np.float64))
+
+
+def _edge_frames(coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute midpoints, unit directions and unit normals for many edges.
+
+    Args:
+        coords: Array of shape (N, 4) with rows (x1, y1, x2, y2).
+
+    Returns:
+        Tuple of (midpoints, directions, perpendiculars), each of shape (N, 2).
+    """
+    start, end = coords[:, :2], coords[:, 2:]
+    delta = end - start
+    direction = delta / np.hypot(delta[:, 0], delta[:, 1])[:, None]
+    perpendicular = np.column_stack((-direction[:, 1], direction[:, 0]))
+    return (start + end) / 2, direction, perpendicular
+
+
+def _compute_capacitor_segments_batch(coords: np.ndarray) -> np.ndarray:
+    """Compute capacitor symbol segments for many straight edges at once.
+
+    All geometry is evaluated with NumPy broadcasting over the edge axis.
+
+    Args:
+        coords: Array of shape (N, 4) with rows (x1, y1, x2, y2).
+
+    Returns:
+        Array of shape (N * 4, 2, 2) suitable for a single LineCollection.
+        Segments for edge i occupy rows 4*i to 4*i + 3.
+    """
+    n_edges = len(coords)
+    mid, direction, perpendicular = _edge_frames(coords)
+    wire1_end = mid - direction * PLATE_GAP
+    wire2_start = mid + direction * PLATE_GAP
+    # (N, 2 plate endpoints, 2 coords): -/+ PLATE_WIDTH along the normal
+    plate_offsets = perpendicular[:, None, :] * np.array([-PLATE_WIDTH, PLATE_WIDTH])[None, :, None]
+
+    segments = np.empty((n_edges, SEGMENTS_PER_CAPACITOR, 2, 2), dtype=np.float64)
+    segments[:, 0, 0] = coords[:, :2]
+    segments[:, 0, 1] = wire1_end
+    segments[:, 1, 0] = wire2_start
+    segments[:, 1, 1] = coords[:, 2:]
+    segments[:, 2] = wire1_end[:, None, :] + plate_offsets
+    segments[:, 3] = wire2_start[:, None, :] + plate_offsets
+    return segments.reshape(n_edges * SEGMENTS_PER_CAPACITOR, 2, 2)
+
+
+def _compute_parallel_edge_curves(
+    coords: np.ndarray,
+    edge_nums: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sample the quadratic Bezier wires of parallel edges sharing one pair.
+
+    The edge frame is computed once for the pair; each edge only differs in
+    how far its control point is pushed along the normal. All curves are
+    evaluated in one ``einsum`` against the precomputed Bernstein basis.
+
+    Args:
+        coords: Array of shape (4,) with (x1, y1, x2, y2) for the pair.
+        edge_nums: Array of shape (K,) with the parallel edge indices (> 0).
+
+    Returns:
+        Tuple of (curves, control_points, perpendicular) with shapes
+        (K, BEZIER_SAMPLES, 2), (K, 2) and (2,).
+    """
+    mid, _, perpendicular = (frame[0] for frame in _edge_frames(coords[None, :]))
+    ctrl = mid + np.outer(CURVE_OFFSET * edge_nums, perpendicular)
+
+    # Control polygons (K, 3 control points, 2 coords)
+    polygons = np.empty((len(edge_nums), 3, 2), dtype=np.float64)
+    polygons[:, 0] = coords[:2]
+    polygons[:, 1] = ctrl
+    polygons[:, 2] = coords[2:]
+    curves = np.einsum('tb,kbd->ktd', _QUADRATIC_BERNSTEIN, polygons)
+    return curves, ctrl, perpendicular
+
+
+def _wire_collection(segments: np.ndarray, **kwargs: Any) -> LineCollection:
+    """Build a wire/plate LineCollection, rasterizing it for large graphs.
+
+    Above RASTERIZE_SEGMENT_THRESHOLD segments the collection is flattened to
+    a bitmap at save time, so vector export cost no longer grows with the
+    edge count. Labels are separate text artists and stay vector.
+    """
+    collection = LineCollection(segments, colors=WIRE_COLOR, **kwargs)
+    if len(segments) > RASTERIZE_SEGMENT_THRESHOLD:
+        collection.set_rasterized(True)
+    return collection
+
+
+def _draw_capacitor_label(
+    ax: plt.Axes,
+    x: float, y: float,
+    label: str,
+    font_size: int = 10
+) -> None:
+    """Draw a capacitance label with white background at (x, y)."""
+    ax.text(x, y, label, ha='center', va='center',
             fontsize=font_size, fontweight='bold', color=LABEL_COLOR,
             bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                      edgecolor=LABEL_COLOR, alpha=0.95),
@@ -936,19 +1023,43 @@ def _draw_capacitor_symbol(
 
 def plot_error_distribution(
     solutions: List[Tuple[Any, float]],
-    target: float
+    target: float,
+    ctx: Optional[_PlotContext] = None
 ) -> plt.Figure:
     """Plot histogram of error distribution for solutions.
 
     Args:
         solutions: List of (topology, capacitance) tuples.
         target: Target capacitance value.
+        ctx: Optional reusable figure context for batch rendering.
 
     Returns:
         Matplotlib figure with error distribution histogram.
     """
-    # Placeholder implementation
-    pass
+    if ctx is not None:
+        fig, ax = ctx.fig, ctx.reset()
+    else:
+        fig, ax = plt.subplots(figsize=(8, 4))
+
+    ceqs = np.fromiter((ceq for _, ceq in solutions), dtype=np.float64, count=len(solutions))
+    errors = np.abs(ceqs - target) / target * 100 if target else np.abs(ceqs - target)
+
+    bins = min(30, max(1, len(errors)))
+    hist_range = None
+    if len(errors) and np.ptp(errors) <= bins * np.spacing(np.abs(errors).max()):
+        # Errors agree to within float resolution; numpy cannot split that
+        # span into bins, so centre a single bin on them instead
+        center = float(errors.mean())
+        half_width = abs(center) * 0.01 or 0.5
+        bins, hist_range = 1, (center - half_width, center + half_width)
+
+    ax.hist(errors, bins=bins, range=hist_range, color=WIRE_COLOR, alpha=0.85)
+    ax.set_xlabel("Relative error (%)" if target else "Absolute error (F)")
+    ax.set_ylabel("Solutions")
+    ax.set_title(f"Error distribution ({len(errors)} solutions)", color=WIRE_COLOR)
+
+    fig.tight_layout()
+    return fig
 
 
 # =============================================================================
@@ -978,8 +1089,11 @@ def generate_sp_latex(
         >>> latex = generate_sp_latex(leaf, ["C1"], [5e-12])
         >>> # Returns complete LaTeX document with circuitikz diagram
     """
-    # Generate the circuit body
-    circuit_body = _generate_sp_latex_recursive(node, capacitor_labels, capacitor_values, 0, 0)
+    # Generate the circuit body from the cached template for this shape
+    template, index_order = _compile_sp_template(node)
+    circuit_body = template.format(*[
+        _leaf_label(i, capacitor_labels, capacitor_values) for i in index_order
+    ])
     
     # Wrap in complete LaTeX document
     latex_code = r"""\documentclass[border=10pt]{standalone}
@@ -1002,81 +1116,139 @@ def generate_sp_latex(
     return latex_code
 
 
+# Placeholder wrapped around capacitor indices while compiling a template;
+# NUL cannot occur in the generated TikZ so it is safe to search for.
+_TEMPLATE_SENTINEL = "\x00"
+_TEMPLATE_SENTINEL_RE = re.compile("\x00(\\d+)\x00")
+
+# Nested shape key: an int capacitor index for a leaf, (KIND, left, right) otherwise
+SPShape = Any
+
+
+def _sp_shape(node: SPNode) -> SPShape:
+    """Return the label-independent shape key of an SP tree."""
+    if node.KIND == 0:
+        return node.capacitor_index
+    return (node.KIND, _sp_shape(node.left), _sp_shape(node.right))
+
+
+def _shape_to_node(shape: SPShape) -> SPNode:
+    """Rebuild a skeleton SP tree (zero values) from its shape key."""
+    if isinstance(shape, int):
+        return Leaf(shape, 0.0)
+    kind, left, right = shape
+    node_type = Series if kind == Series.KIND else Parallel
+    return node_type(_shape_to_node(left), _shape_to_node(right))
+
+
+def _iter_shape_indices(shape: SPShape) -> Iterator[int]:
+    """Yield the capacitor indices contained in a shape key."""
+    stack = [shape]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, int):
+            yield item
+        else:
+            stack.append(item[1])
+            stack.append(item[2])
+
+
+@lru_cache(maxsize=1024)
+def _compile_sp_shape(shape: SPShape) -> Tuple[str, Tuple[int, ...]]:
+    """Compile an SP shape into a ``str.format`` template (cached per shape)."""
+    skeleton = _shape_to_node(shape)
+    n_caps = max(_iter_shape_indices(shape)) + 1
+    sentinels = [f"{_TEMPLATE_SENTINEL}{i}{_TEMPLATE_SENTINEL}" for i in range(n_caps)]
+    body = _generate_sp_latex_recursive(skeleton, sentinels, None)
+
+    index_order: List[int] = []
+
+    def to_field(match: re.Match) -> str:
+        index_order.append(int(match.group(1)))
+        return f"{{{len(index_order) - 1}}}"
+
+    escaped = body.replace("{", "{{").replace("}", "}}")
+    return _TEMPLATE_SENTINEL_RE.sub(to_field, escaped), tuple(index_order)
+
+
+def _compile_sp_template(node: SPNode) -> Tuple[str, Tuple[int, ...]]:
+    """Compile the CircuiTikZ body of an SP tree into a format template.
+
+    The tree is walked once to compute its shape; the structural recursion
+    of _generate_sp_latex_recursive only runs the first time a shape is seen.
+    Rendering is then ``template.format(*[labels[i] for i in index_order])``.
+
+    Args:
+        node: Root SPNode of the network topology.
+
+    Returns:
+        Tuple of (format template, capacitor index per positional field).
+    """
+    return _compile_sp_shape(_sp_shape(node))
+
+
+def _leaf_label(
+    index: int,
+    capacitor_labels: List[str],
+    capacitor_values: Optional[List[float]]
+) -> str:
+    """Label of a single capacitor, with its value when values are given."""
+    label = capacitor_labels[index]
+    if capacitor_values is not None:
+        return f"{label}={_format_capacitance_latex(capacitor_values[index])}"
+    return label
+
+
 def _generate_sp_latex_recursive(
     node: SPNode,
     capacitor_labels: List[str],
     capacitor_values: Optional[List[float]],
-    x: float,
-    y: float,
+    start_anchor: str = "(0,0)",
     depth: int = 0
 ) -> str:
     """Recursively generate CircuiTikZ code for SP topology.
     
+    Each fragment starts at ``start_anchor`` and leaves the TikZ coordinate
+    ``(end)`` at its output terminal, so a series right branch is emitted
+    directly with ``start_anchor="(end)"`` (no post-hoc string rewriting).
+    
     Args:
         node: Current SPNode.
         capacitor_labels: Labels for capacitors.
         capacitor_values: Optional values for labels.
-        x: Current x position.
-        y: Current y position.
+        start_anchor: TikZ coordinate the fragment starts from.
         depth: Recursion depth for naming.
     
     Returns:
         CircuiTikZ draw commands as string.
     """
-    if isinstance(node, Leaf):
+    kind = node.KIND
+    if kind == 0:  # Leaf
         # Single capacitor
-        label = capacitor_labels[node.capacitor_index]
-        if capacitor_values is not None:
-            value = capacitor_values[node.capacitor_index]
-            value_str = _format_capacitance_latex(value)
-            cap_label = f"{label}={value_str}"
-        else:
-            cap_label = label
-        
-        return f"    \\draw ({x},{y}) to[C, l={{{cap_label}}}] ++(2,0) coordinate (end);\n"
+        cap_label = _get_node_label(node, capacitor_labels, capacitor_values)
+        return f"    \\draw {start_anchor} to[C, l={{{cap_label}}}] ++(2,0) coordinate (end);\n"
     
-    elif isinstance(node, Series):
-        # Series: draw left, then right from endpoint
+    elif kind == 1:  # Series
+        # Series: draw left, then continue right from the left's (end)
         left_code = _generate_sp_latex_recursive(
-            node.left, capacitor_labels, capacitor_values, x, y, depth + 1
+            node.left, capacitor_labels, capacitor_values, start_anchor, depth + 1
         )
-        # For series, continue from 'end' coordinate
         right_code = _generate_sp_latex_recursive(
-            node.right, capacitor_labels, capacitor_values, 0, 0, depth + 1
+            node.right, capacitor_labels, capacitor_values, "(end)", depth + 1
         )
-        # Replace start position with (end) for right side
-        right_code = right_code.replace(f"\\draw (0,0)", "\\draw (end)", 1)
         return left_code + right_code
     
-    elif isinstance(node, Parallel):
-        # Parallel: split into two branches
-        lines = []
-        lines.append(f"    \\draw ({x},{y}) coordinate (split{depth});")
-        
-        # Top branch (left subtree)
-        top_code = _generate_sp_latex_recursive(
-            node.left, capacitor_labels, capacitor_values, 0, 0.5, depth + 1
-        )
-        top_code = top_code.replace("\\draw (0,0.5)", f"\\draw (split{depth}) -- ++(0,0.5) coordinate (top{depth}) to[C", 1)
-        top_code = top_code.replace("to[C,", "to[C,")
-        
-        # Bottom branch (right subtree)  
-        bot_code = _generate_sp_latex_recursive(
-            node.right, capacitor_labels, capacitor_values, 0, -0.5, depth + 1
-        )
-        bot_code = bot_code.replace("\\draw (0,-0.5)", f"\\draw (split{depth}) -- ++(0,-0.5) coordinate (bot{depth}) to[C", 1)
-        
-        # Simplified parallel structure
+    elif kind == 2:  # Parallel
+        # Simplified parallel structure: one capacitor symbol per branch
         left_label = _get_node_label(node.left, capacitor_labels, capacitor_values)
         right_label = _get_node_label(node.right, capacitor_labels, capacitor_values)
         
-        parallel_code = f"""    \\draw ({x},{y}) coordinate (split{depth})
+        return f"""    \\draw {start_anchor} coordinate (split{depth})
         (split{depth}) -- ++(0,0.5) to[C, l={{{left_label}}}] ++(2,0) coordinate (topend{depth})
         (split{depth}) -- ++(0,-0.5) to[C, l={{{right_label}}}] ++(2,0) coordinate (botend{depth})
         (topend{depth}) -- ++(0,-0.5) coordinate (end)
         (botend{depth}) -- ++(0,0.5);
 """
-        return parallel_code
     
     return ""
 
@@ -1087,27 +1259,37 @@ def _get_node_label(
     capacitor_values: Optional[List[float]]
 ) -> str:
     """Get label for a node (for simple display in parallel branches)."""
-    if isinstance(node, Leaf):
-        label = capacitor_labels[node.capacitor_index]
-        if capacitor_values is not None:
-            value = capacitor_values[node.capacitor_index]
-            value_str = _format_capacitance_latex(value)
-            return f"{label}={value_str}"
-        return label
-    elif isinstance(node, Series):
+    kind = node.KIND
+    if kind == 0:  # Leaf
+        return _leaf_label(node.capacitor_index, capacitor_labels, capacitor_values)
+    elif kind == 1:  # Series
         left = _get_node_label(node.left, capacitor_labels, capacitor_values)
         right = _get_node_label(node.right, capacitor_labels, capacitor_values)
         return f"({left} + {right})"
-    elif isinstance(node, Parallel):
+    elif kind == 2:  # Parallel
         left = _get_node_label(node.left, capacitor_labels, capacitor_values)
         right = _get_node_label(node.right, capacitor_labels, capacitor_values)
         return f"({left} || {right})"
     return "?"
 
 
+# (scale, siunitx prefix) per decade bucket: pF, nF, µF, mF, F
+_SI_TABLE = (
+    (1e12, r"\pico"),
+    (1e9, r"\nano"),
+    (1e6, r"\micro"),
+    (1e3, r"\milli"),
+    (1.0, ""),
+)
+
+
 def _format_capacitance_latex(value: float) -> str:
     """Format capacitance value for LaTeX with siunitx.
     
+    The SI prefix is looked up in _SI_TABLE from the value's decade
+    (one log10 instead of a threshold ladder). Values below 1pF use pF
+    and values of 1F or more use plain farads.
+    
     Args:
         value: Capacitance in Farads.
     
@@ -1116,19 +1298,12 @@ def _format_capacitance_latex(value: float) -> str:
     """
     if value == 0:
         return r"\SI{0}{\farad}"
-    
-    abs_value = abs(value)
-    
-    if abs_value < 1e-9:  # < 1nF -> pF
-        return f"\\SI{{{value * 1e12:.4g}}}{{\\pico\\farad}}"
-    elif abs_value < 1e-6:  # < 1µF -> nF
-        return f"\\SI{{{value * 1e9:.4g}}}{{\\nano\\farad}}"
-    elif abs_value < 1e-3:  # < 1mF -> µF
-        return f"\\SI{{{value * 1e6:.4g}}}{{\\micro\\farad}}"
-    elif abs_value < 1:  # < 1F -> mF
-        return f"\\SI{{{value * 1e3:.4g}}}{{\\milli\\farad}}"
-    else:
+    if not math.isfinite(value):
         return f"\\SI{{{value:.4g}}}{{\\farad}}"
+    
+    bucket = int((math.log10(abs(value)) + 12) // 3)
+    scale, unit = _SI_TABLE[max(0, min(4, bucket))]
+    return f"\\SI{{{value * scale:.4g}}}{{{unit}\\farad}}"
 
 
 def generate_graph_latex(topology: GraphTopology) -> str:
@@ -1192,6 +1367,37 @@ def generate_graph_latex(topology: GraphTopology) -> str:
     return latex_code
 
 
+def _sp_latex_with_default_labels(
+    topology: SPNode,
+    capacitor_labels: Optional[List[str]],
+    capacitor_values: Optional[List[float]]
+) -> str:
+    """Generate SP LaTeX, creating C1..Cn labels when none are given."""
+    if capacitor_labels is None:
+        # Highest index + 1 == bit length of the index mask
+        n_labels = _collect_indices(topology).bit_length()
+        capacitor_labels = [f"C{i+1}" for i in range(n_labels)]
+    return generate_sp_latex(topology, capacitor_labels, capacitor_values)
+
+
+def _graph_latex_ignoring_labels(
+    topology: GraphTopology,
+    capacitor_labels: Optional[List[str]],
+    capacitor_values: Optional[List[float]]
+) -> str:
+    """Generate graph LaTeX (edge capacitances carry their own values)."""
+    return generate_graph_latex(topology)
+
+
+# Exact-type dispatch table for generate_latex_code (one dict lookup per call)
+_LATEX_DISPATCH = {
+    GraphTopology: _graph_latex_ignoring_labels,
+    Leaf: _sp_latex_with_default_labels,
+    Series: _sp_latex_with_default_labels,
+    Parallel: _sp_latex_with_default_labels,
+}
+
+
 def generate_latex_code(
     topology,
     capacitor_labels: Optional[List[str]] = None,
@@ -1210,22 +1416,32 @@ def generate_latex_code(
     Returns:
         Complete LaTeX document string.
     """
-    if isinstance(topology, GraphTopology):
-        return generate_graph_latex(topology)
-    elif isinstance(topology, (Leaf, Series, Parallel)):
-        if capacitor_labels is None:
-            # Generate default labels
-            indices = _collect_indices(topology)
-            capacitor_labels = [f"C{i+1}" for i in range(max(indices) + 1)]
-        return generate_sp_latex(topology, capacitor_labels, capacitor_values)
-    else:
-        return "% Unknown topology type"
+    generator = _LATEX_DISPATCH.get(type(topology))
+    if generator is None:
+        # Subclasses miss the exact-type table; fall back to isinstance
+        if isinstance(topology, GraphTopology):
+            generator = _graph_latex_ignoring_labels
+        elif isinstance(topology, (Leaf, Series, Parallel)):
+            generator = _sp_latex_with_default_labels
+        else:
+            return "% Unknown topology type"
+    return generator(topology, capacitor_labels, capacitor_values)
 
 
-def _collect_indices(node: SPNode) -> set:
-    """Collect all capacitor indices from SP tree."""
-    if isinstance(node, Leaf):
-        return {node.capacitor_index}
-    elif isinstance(node, (Series, Parallel)):
-        return _collect_indices(node.left) | _collect_indices(node.right)
-    return set()
+def _collect_indices(node: SPNode) -> int:
+    """Collect all capacitor indices from SP tree as a bitmask.
+
+    Bit ``i`` of the returned integer is set when capacitor index ``i``
+    appears in the tree, so ``mask.bit_length()`` equals the highest
+    index + 1. Uses an explicit stack, so no recursion frames are created.
+    """
+    mask = 0
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.KIND == 0:  # Leaf
+            mask |= 1 << current.capacitor_index
+        else:  # Series / Parallel
+            stack.append(current.left)
+            stack.append(current.right)
+    return mask
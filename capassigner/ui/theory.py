@@ -3,32 +3,100 @@
 This module provides theory explanations, formulas, and educational content
 for each synthesis method (SP exhaustive, heuristics, graph-based).
 
-Displays content using st.latex for formulas and st.expander for
-collapsible theory sections.
+Displays formulas as pre-built KaTeX display-math markdown and uses
+st.expander for collapsible theory sections.
 
 Constitutional Compliance:
     - Principle II (UX First): Clear educational content
     - Principle V (Extensibility): Modular theory content functions
 """
 
-from typing import Any, Dict, List
+import html
+import inspect
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Sequence, Tuple
 import streamlit as st
 
 
-def get_sp_theory_content() -> Dict[str, Any]:
-    """Get theory content for Series-Parallel networks (T071).
+# Frozen content records. __slots__ is declared by hand (dataclass(slots=True)
+# needs Python 3.10) so instances carry no per-instance __dict__.
 
-    Returns:
-        Dictionary with keys:
-            - title: Section title
-            - explanation: Detailed explanation text
-            - formulas: List of (latex_string, description) tuples
-            - when_to_use: When to use this method
-            - complexity: Time/space complexity description
+@dataclass(frozen=True)
+class TheorySection:
+    """Theory content of a synthesis method.
+
+    Attributes:
+        title: Section title.
+        explanation: Detailed explanation text (markdown).
+        formulas: Tuple of (latex_string, description) tuples.
+        when_to_use: When to use this method.
+        complexity: Time/space complexity description.
+    """
+    __slots__ = ("title", "explanation", "formulas", "when_to_use", "complexity")
+
+    title: str
+    explanation: str
+    formulas: Tuple[Tuple[str, str], ...]
+    when_to_use: str
+    complexity: str
+
+
+@dataclass(frozen=True)
+class EnumerationTheory:
+    """Theory content for topology enumeration and Catalan numbers.
+
+    Attributes:
+        title: Section title.
+        explanation: Detailed explanation text (markdown).
+        formulas: Tuple of (latex_string, description) tuples.
+        catalan_sequence: (n, C_n) pairs of the Catalan sequence.
+        empirical_header: Column names of the empirical topology counts.
+        empirical_rows: Rows of empirical topology counts.
+        empirical_explanation: Why the empirical counts differ from the bound.
+        references: Academic references.
+    """
+    __slots__ = (
+        "title", "explanation", "formulas", "catalan_sequence",
+        "empirical_header", "empirical_rows", "empirical_explanation", "references",
+    )
+
+    title: str
+    explanation: str
+    formulas: Tuple[Tuple[str, str], ...]
+    catalan_sequence: Tuple[Tuple[int, int], ...]
+    empirical_header: Tuple[str, ...]
+    empirical_rows: Tuple[Tuple[Any, ...], ...]
+    empirical_explanation: str
+    references: str
+
+
+@dataclass(frozen=True)
+class MethodComparison:
+    """Method comparison table and recommendations.
+
+    Attributes:
+        title: Section title.
+        comparison_header: Column names of the comparison table.
+        comparison_rows: Rows of the comparison table.
+        recommendations: Guidance for choosing a method (markdown).
+        complexity_comparison: Complexity comparison table (markdown).
     """
-    return {
-        "title": "Series-Parallel (SP) Networks",
-        "explanation": """
+    __slots__ = (
+        "title", "comparison_header", "comparison_rows",
+        "recommendations", "complexity_comparison",
+    )
+
+    title: str
+    comparison_header: Tuple[str, ...]
+    comparison_rows: Tuple[Tuple[str, ...], ...]
+    recommendations: str
+    complexity_comparison: str
+
+
+SP_THEORY_CONTENT: Final[TheorySection] = TheorySection(
+    title="Series-Parallel (SP) Networks",
+    explanation="""
 **Series-Parallel networks** are the most common type of capacitor configurations.
 They can be fully described by binary trees where:
 
@@ -39,22 +107,22 @@ These networks are "well-structured" and can be recursively decomposed into simp
 sub-networks. The SP Exhaustive method enumerates all possible binary tree topologies
 that combine the input capacitors.
 """,
-        "formulas": [
-            (r"C_{series} = \frac{1}{\frac{1}{C_1} + \frac{1}{C_2} + \cdots + \frac{1}{C_n}}", 
-             "Series combination formula"),
-            (r"C_{parallel} = C_1 + C_2 + \cdots + C_n", 
-             "Parallel combination formula"),
-            (r"T(n) = \text{Cat}(n-1) \times n!", 
-             "Number of SP topologies for n capacitors (Catalan number × permutations)"),
-        ],
-        "when_to_use": """
+    formulas=(
+        (r"C_{series} = \frac{1}{\frac{1}{C_1} + \frac{1}{C_2} + \cdots + \frac{1}{C_n}}", 
+         "Series combination formula"),
+        (r"C_{parallel} = C_1 + C_2 + \cdots + C_n", 
+         "Parallel combination formula"),
+        (r"T(n) = \text{Cat}(n-1) \times n!", 
+         "Number of SP topologies for n capacitors (Catalan number × permutations)"),
+    ),
+    when_to_use="""
 ✅ Use SP Exhaustive when:
 - You have **N ≤ 8** capacitors
 - You want **guaranteed optimal** solutions
 - Your circuit must use standard series/parallel connections
 - You need **exact enumeration** of all possibilities
 """,
-        "complexity": """
+    complexity="""
 **Time Complexity**: O(Cat(n) × n!)
 - Cat(n) ≈ 4ⁿ / (n^1.5 × √π)
 - For n=8: ~264,600 topologies
@@ -63,14 +131,22 @@ that combine the input capacitors.
 
 The algorithm uses **memoization** to avoid recomputing equivalent subtrees.
 """
-    }
+)
 
 
-def get_sp_graph_theory_content() -> Dict[str, Any]:
-    """Get theory content for SP Graph Exhaustive method."""
-    return {
-        "title": "SP Graph Exhaustive",
-        "explanation": """
+def get_sp_theory_content() -> TheorySection:
+    """Get theory content for Series-Parallel networks (T071).
+
+    Returns:
+        TheorySection with the title, explanation, formulas, when_to_use
+        and complexity of the SP method.
+    """
+    return SP_THEORY_CONTENT
+
+
+SP_GRAPH_THEORY_CONTENT: Final[TheorySection] = TheorySection(
+    title="SP Graph Exhaustive",
+    explanation="""
 **SP Graph Exhaustive** extends the Series-Parallel concept to general graphs.
 Unlike the Tree method which builds circuits from the bottom up, this method:
 1. Enumerates all connected **multigraph topologies** with N edges.
@@ -84,37 +160,36 @@ which are still SP-reducible but cannot be represented as simple binary trees.
 A circuit with 4 capacitors can form a structure with internal nodes C and D
 that reduces to a single equivalent capacitance, even if it's not a simple ladder.
 """,
-        "formulas": [
-            (r"V \in [2, N+1]", "Number of nodes ranges from 2 (all parallel) to N+1 (all series)"),
-            (r"C_{parallel} = \sum C_i", "Parallel reduction rule (edges between same nodes)"),
-            (r"C_{series} = (1/C_1 + 1/C_2)^{-1}", "Series reduction rule (degree-2 internal node)"),
-        ],
-        "when_to_use": """
+    formulas=(
+        (r"V \in [2, N+1]", "Number of nodes ranges from 2 (all parallel) to N+1 (all series)"),
+        (r"C_{parallel} = \sum C_i", "Parallel reduction rule (edges between same nodes)"),
+        (r"C_{series} = (1/C_1 + 1/C_2)^{-1}", "Series reduction rule (degree-2 internal node)"),
+    ),
+    when_to_use="""
 ✅ Use SP Graph Exhaustive when:
 - You have **N ≤ 6** capacitors
 - You suspect the solution requires **internal nodes** (bridges)
 - SP Tree method fails to find an exact solution
 - You still want a guaranteed SP-reducible circuit
 """,
-        "complexity": """
+    complexity="""
 **Time Complexity**: High (Exponential)
 - Enumerates all multigraphs + all permutations of capacitors.
 - Much slower than SP Tree for N > 6.
 
 **Space Complexity**: O(N + E) for graph storage.
 """
-    }
+)
 
 
-def get_laplacian_theory_content() -> Dict[str, Any]:
-    """Get theory content for Laplacian/graph-based analysis (T072).
+def get_sp_graph_theory_content() -> TheorySection:
+    """Get theory content for SP Graph Exhaustive method."""
+    return SP_GRAPH_THEORY_CONTENT
 
-    Returns:
-        Dictionary with theory content for the Laplacian nodal analysis method.
-    """
-    return {
-        "title": "Laplacian Nodal Analysis",
-        "explanation": """
+
+LAPLACIAN_THEORY_CONTENT: Final[TheorySection] = TheorySection(
+    title="Laplacian Nodal Analysis",
+    explanation="""
 **Graph-based analysis** uses nodal admittance matrices to compute the equivalent
 capacitance of arbitrary network topologies, including **non-SP configurations**
 like Wheatstone bridges and delta-wye networks.
@@ -129,26 +204,26 @@ Using Laplacian (nodal) analysis, we apply boundary conditions:
 
 The current flowing into terminal A equals the equivalent capacitance (in s-domain).
 """,
-        "formulas": [
-            (r"\mathbf{Y} = s \cdot \mathbf{C}", 
-             "Admittance matrix (Y = s×C for capacitors)"),
-            (r"\mathbf{Y} \cdot \mathbf{V} = \mathbf{I}", 
-             "Nodal equation (Kirchhoff's current law)"),
-            (r"V_A = 1, \quad V_B = 0", 
-             "Boundary conditions at terminals"),
-            (r"C_{eq} = I_A = \sum_j Y_{A,j} \cdot V_j", 
-             "Equivalent capacitance equals current at terminal A"),
-            (r"\mathbf{C} = \begin{bmatrix} \sum C_j & -C_{1,2} & \cdots \\ -C_{1,2} & \sum C_k & \cdots \\ \vdots & \vdots & \ddots \end{bmatrix}", 
-             "Laplacian matrix structure"),
-        ],
-        "when_to_use": """
+    formulas=(
+        (r"\mathbf{Y} = s \cdot \mathbf{C}", 
+         "Admittance matrix (Y = s×C for capacitors)"),
+        (r"\mathbf{Y} \cdot \mathbf{V} = \mathbf{I}", 
+         "Nodal equation (Kirchhoff's current law)"),
+        (r"V_A = 1, \quad V_B = 0", 
+         "Boundary conditions at terminals"),
+        (r"C_{eq} = I_A = \sum_j Y_{A,j} \cdot V_j", 
+         "Equivalent capacitance equals current at terminal A"),
+        (r"\mathbf{C} = \begin{bmatrix} \sum C_j & -C_{1,2} & \cdots \\ -C_{1,2} & \sum C_k & \cdots \\ \vdots & \vdots & \ddots \end{bmatrix}", 
+         "Laplacian matrix structure"),
+    ),
+    when_to_use="""
 ✅ Use Laplacian analysis when:
 - Working with **non-SP topologies** (bridges, meshes, delta/wye)
 - Analyzing **arbitrary graph structures**
 - You need to compute C_eq for **given topologies**
 - Handling networks with **internal nodes**
 """,
-        "complexity": """
+    complexity="""
 **Time Complexity**: O(n³) for matrix inversion
 - Uses LU decomposition or pseudo-inverse for singular matrices
 
@@ -156,18 +231,21 @@ The current flowing into terminal A equals the equivalent capacitance (in s-doma
 
 Very efficient for evaluating single topologies, but not for enumeration.
 """
-    }
+)
 
 
-def get_heuristic_theory_content() -> Dict[str, Any]:
-    """Get theory content for heuristic random graph search (T073).
+def get_laplacian_theory_content() -> TheorySection:
+    """Get theory content for Laplacian/graph-based analysis (T072).
 
     Returns:
-        Dictionary with theory content for the heuristic search method.
+        TheorySection with theory content for the Laplacian nodal analysis method.
     """
-    return {
-        "title": "Heuristic Graph Search",
-        "explanation": """
+    return LAPLACIAN_THEORY_CONTENT
+
+
+HEURISTIC_THEORY_CONTENT: Final[TheorySection] = TheorySection(
+    title="Heuristic Graph Search",
+    explanation="""
 **Heuristic search** explores the space of arbitrary graph topologies using random
 generation and evaluation. Unlike SP Exhaustive, it can discover **non-SP solutions**
 that may achieve better matches to the target capacitance.
@@ -181,15 +259,15 @@ The algorithm:
 The search uses **deterministic seeding** for reproducibility: given the same
 seed, iterations, and capacitors, you will get identical results.
 """,
-        "formulas": [
-            (r"N_{topologies} = O\left( n^{(n+k)} \right)", 
-             "Approximate topology space size (n edges, k internal nodes)"),
-            (r"P_{success} = 1 - (1 - p_{good})^{iterations}", 
-             "Probability of finding a good solution"),
-            (r"C_{eq}^{graph} = \text{Laplacian}(G, \{C_i\})", 
-             "Graph evaluation using nodal analysis"),
-        ],
-        "when_to_use": """
+    formulas=(
+        (r"N_{topologies} = O\left( n^{(n+k)} \right)", 
+         "Approximate topology space size (n edges, k internal nodes)"),
+        (r"P_{success} = 1 - (1 - p_{good})^{iterations}", 
+         "Probability of finding a good solution"),
+        (r"C_{eq}^{graph} = \text{Laplacian}(G, \{C_i\})", 
+         "Graph evaluation using nodal analysis"),
+    ),
+    when_to_use="""
 ✅ Use Heuristic Search when:
 - You have **N > 8** capacitors
 - SP Exhaustive is **too slow** or times out
@@ -197,7 +275,7 @@ seed, iterations, and capacitors, you will get identical results.
 - You're willing to trade **guaranteed optimality** for **speed**
 - You want **reproducible** random exploration (set a seed)
 """,
-        "complexity": """
+    complexity="""
 **Time Complexity**: O(iterations × n³)
 - Each iteration: O(n³) for Laplacian evaluation
 - Typical: 1000-10000 iterations
@@ -207,23 +285,21 @@ seed, iterations, and capacitors, you will get identical results.
 The **iterations** parameter controls exploration depth. More iterations
 increase the probability of finding optimal or near-optimal solutions.
 """
-    }
+)
 
 
-def get_enumeration_theory_content() -> Dict[str, Any]:
-    """Get theory content for topology enumeration and Catalan numbers.
+def get_heuristic_theory_content() -> TheorySection:
+    """Get theory content for heuristic random graph search (T073).
 
     Returns:
-        Dictionary with keys:
-            - title: Section title
-            - explanation: Detailed explanation text
-            - formulas: List of (latex_string, description) tuples
-            - empirical_data: Table of empirical topology counts
-            - references: Academic references
+        TheorySection with theory content for the heuristic search method.
     """
-    return {
-        "title": "Topology Enumeration & Catalan Numbers",
-        "explanation": """
+    return HEURISTIC_THEORY_CONTENT
+
+
+ENUMERATION_THEORY_CONTENT: Final[EnumerationTheory] = EnumerationTheory(
+    title="Topology Enumeration & Catalan Numbers",
+    explanation="""
 **Series-Parallel topology enumeration** is closely related to the **Catalan numbers**,
 a famous sequence in combinatorics that counts various recursive structures.
 
@@ -244,29 +320,30 @@ node represents either a series or parallel operation.
 The sequence was discovered by **Minggatu** in the 1730s and later studied by
 **Eugène Charles Catalan** (1814-1894).
 """,
-        "formulas": [
-            (r"C_n = \frac{1}{n+1} \binom{2n}{n} = \frac{(2n)!}{(n+1)! \cdot n!}",
-             "Catalan number formula (closed form)"),
-            (r"C_0 = 1, \quad C_{n+1} = \sum_{i=0}^{n} C_i \cdot C_{n-i}",
-             "Recurrence relation for Catalan numbers"),
-            (r"C_n \sim \frac{4^n}{n^{3/2} \sqrt{\pi}}",
-             "Asymptotic growth (Stirling's approximation)"),
-            (r"T(n) = C_{n-1} \times n! \times 2^{n-1}",
-             "Upper bound for SP topologies (tree structures × permutations × operations)"),
-        ],
-        "catalan_sequence": [
-            (0, 1), (1, 1), (2, 2), (3, 5), (4, 14), (5, 42), (6, 132), (7, 429), (8, 1430)
-        ],
-        "empirical_data": [
-            {"n": 2, "Topologies": 2, "Formula Estimate": "C₁ × 2! = 2"},
-            {"n": 3, "Topologies": 8, "Formula Estimate": "C₂ × 3! × 2 = 24 (upper bound)"},
-            {"n": 4, "Topologies": 40, "Formula Estimate": "5 × 24 × 4 = 480 (upper bound)"},
-            {"n": 5, "Topologies": 224, "Formula Estimate": "14 × 120 × 8 = 13,440 (upper bound)"},
-            {"n": 6, "Topologies": 1344, "Formula Estimate": "42 × 720 × 16 = 483,840 (upper bound)"},
-            {"n": 7, "Topologies": 8448, "Formula Estimate": "132 × 5040 × 32 (upper bound)"},
-            {"n": 8, "Topologies": 54912, "Formula Estimate": "429 × 40320 × 64 (upper bound)"},
-        ],
-        "empirical_explanation": """
+    formulas=(
+        (r"C_n = \frac{1}{n+1} \binom{2n}{n} = \frac{(2n)!}{(n+1)! \cdot n!}",
+         "Catalan number formula (closed form)"),
+        (r"C_0 = 1, \quad C_{n+1} = \sum_{i=0}^{n} C_i \cdot C_{n-i}",
+         "Recurrence relation for Catalan numbers"),
+        (r"C_n \sim \frac{4^n}{n^{3/2} \sqrt{\pi}}",
+         "Asymptotic growth (Stirling's approximation)"),
+        (r"T(n) = C_{n-1} \times n! \times 2^{n-1}",
+         "Upper bound for SP topologies (tree structures × permutations × operations)"),
+    ),
+    catalan_sequence=(
+        (0, 1), (1, 1), (2, 2), (3, 5), (4, 14), (5, 42), (6, 132), (7, 429), (8, 1430)
+    ),
+    empirical_header=("n", "Topologies", "Formula Estimate"),
+    empirical_rows=(
+        (2, 2, "C₁ × 2! = 2"),
+        (3, 8, "C₂ × 3! × 2 = 24 (upper bound)"),
+        (4, 40, "5 × 24 × 4 = 480 (upper bound)"),
+        (5, 224, "14 × 120 × 8 = 13,440 (upper bound)"),
+        (6, 1344, "42 × 720 × 16 = 483,840 (upper bound)"),
+        (7, 8448, "132 × 5040 × 32 (upper bound)"),
+        (8, 54912, "429 × 40320 × 64 (upper bound)"),
+    ),
+    empirical_explanation="""
 ### Why Empirical Values?
 
 The actual number of **distinct** SP topologies is **less** than the theoretical upper bound
@@ -293,7 +370,7 @@ progress bar estimation during exhaustive search.
 The growth factor approaches 6-7× per additional capacitor, which is consistent with
 combinatorial analysis of labeled binary trees.
 """,
-        "references": """
+    references="""
 ### Academic References
 
 1. **Richard P. Stanley** (2015). *Catalan Numbers*. Cambridge University Press.
@@ -315,41 +392,33 @@ combinatorial analysis of labeled binary trees.
    *Wikipedia, The Free Encyclopedia*.
    - Accessible introductions to these concepts.
 """
-    }
+)
 
+# Catalan sequence as shown in the code block of the enumeration section
+_CATALAN_CODE_STR: Final[str] = ", ".join(
+    f"C({n})={c}" for n, c in ENUMERATION_THEORY_CONTENT.catalan_sequence
+)
 
-def get_method_comparison_content() -> Dict[str, Any]:
-    """Get method comparison content (T074).
+
+def get_enumeration_theory_content() -> EnumerationTheory:
+    """Get theory content for topology enumeration and Catalan numbers.
 
     Returns:
-        Dictionary with comparison table data and recommendations.
+        EnumerationTheory with the explanation, formulas, Catalan sequence,
+        empirical topology counts and academic references.
     """
-    return {
-        "title": "Method Comparison",
-        "comparison_table": [
-            {
-                "Method": "SP Tree Exhaustive",
-                "Speed": "Fast (N≤8)",
-                "Topology Coverage": "SP Trees",
-                "Optimality": "Guaranteed (Tree)",
-                "Best For": "Standard SP circuits"
-            },
-            {
-                "Method": "SP Graph Exhaustive",
-                "Speed": "Slow (N≤6)",
-                "Topology Coverage": "SP Graphs (w/ bridges)",
-                "Optimality": "Guaranteed (SP)",
-                "Best For": "Complex SP circuits"
-            },
-            {
-                "Method": "Heuristic Graph",
-                "Speed": "Configurable",
-                "Topology Coverage": "All (SP + non-SP)",
-                "Optimality": "Probabilistic",
-                "Best For": "Large N, exploration"
-            },
-        ],
-        "recommendations": """
+    return ENUMERATION_THEORY_CONTENT
+
+
+METHOD_COMPARISON_CONTENT: Final[MethodComparison] = MethodComparison(
+    title="Method Comparison",
+    comparison_header=("Method", "Speed", "Topology Coverage", "Optimality", "Best For"),
+    comparison_rows=(
+        ("SP Tree Exhaustive", "Fast (N≤8)", "SP Trees", "Guaranteed (Tree)", "Standard SP circuits"),
+        ("SP Graph Exhaustive", "Slow (N≤6)", "SP Graphs (w/ bridges)", "Guaranteed (SP)", "Complex SP circuits"),
+        ("Heuristic Graph", "Configurable", "All (SP + non-SP)", "Probabilistic", "Large N, exploration"),
+    ),
+    recommendations="""
 ### Choosing the Right Method
 
 | Scenario | Recommended Method |
@@ -361,14 +430,175 @@ def get_method_comparison_content() -> Dict[str, Any]:
 | Need non-SP bridges | Heuristic Graph Search |
 | Need guaranteed optimal | SP Tree/Graph Exhaustive |
 """,
-        "complexity_comparison": """
+    complexity_comparison="""
 | Method | Time | Space | Guarantee |
 |--------|------|-------|-----------|
 | SP Tree Exhaustive | O(Cat(n)×n!) | O(n) | Optimal within SP Tree |
 | SP Graph Exhaustive | O(Exp(n)) | O(n+e) | Optimal within SP Graph |
 | Heuristic Graph | O(iter×n³) | O(n²) | Best-effort |
 """
-    }
+)
+
+
+def get_method_comparison_content() -> MethodComparison:
+    """Get method comparison content (T074).
+
+    Returns:
+        MethodComparison with comparison table data and recommendations.
+    """
+    return METHOD_COMPARISON_CONTENT
+
+
+# Section headers shared by the pre-assembled theory markdown
+_H_FORMULAS: Final[str] = "### Key Formulas"
+_H_WHEN: Final[str] = "### When to Use"
+_H_COMPLEXITY: Final[str] = "### Complexity"
+
+
+# Pre-assembled markdown for the theory expanders. Each expander is sent as a
+# single st.markdown blob (formulas as $$...$$ KaTeX blocks) instead of one
+# element per paragraph/formula; the bodies are built once at import.
+#
+# NOTE: cache theory content and its renderings with st.cache_resource only.
+# Do NOT use st.cache_data here: it pickles and copies the multi-KB return
+# values on every hit, which is pure overhead for read-only static content.
+
+def _formula_markdown(latex: str, description: str) -> str:
+    """Render one formula as a KaTeX display-math block with a caption."""
+    return f"$$\n{latex}\n$$\n\n<small>{html.escape(description, quote=False)}</small>"
+
+
+# Formula blocks of the static theory sections, built once at import
+_FORMULA_BLOCKS: Final[Dict[Tuple[str, str], str]] = {
+    formula: _formula_markdown(*formula)
+    for content in (
+        SP_THEORY_CONTENT,
+        LAPLACIAN_THEORY_CONTENT,
+        HEURISTIC_THEORY_CONTENT,
+        ENUMERATION_THEORY_CONTENT,
+    )
+    for formula in content.formulas
+}
+
+
+def _formulas_markdown(formulas: Sequence[Tuple[str, str]]) -> str:
+    """Render (latex, description) pairs as display math with captions."""
+    return "\n\n".join(
+        _FORMULA_BLOCKS.get(formula) or _formula_markdown(*formula)
+        for formula in formulas
+    )
+
+
+# Joined formula markdown per static section, keyed by its formulas tuple
+_SECTION_FORMULAS_MD: Final[Dict[Tuple[Tuple[str, str], ...], str]] = {
+    content.formulas: _formulas_markdown(content.formulas)
+    for content in (
+        SP_THEORY_CONTENT,
+        SP_GRAPH_THEORY_CONTENT,
+        LAPLACIAN_THEORY_CONTENT,
+        HEURISTIC_THEORY_CONTENT,
+        ENUMERATION_THEORY_CONTENT,
+    )
+}
+
+
+def _theory_section_markdown(content: TheorySection) -> str:
+    """Assemble a standard theory section (explanation/formulas/usage/complexity)."""
+    return "\n\n".join([
+        content.explanation,
+        _H_FORMULAS,
+        _SECTION_FORMULAS_MD[content.formulas],
+        _H_WHEN,
+        content.when_to_use,
+        _H_COMPLEXITY,
+        content.complexity,
+    ])
+
+
+# Expander bodies, assembled once at import
+_SP_THEORY_MD: Final[str] = _theory_section_markdown(SP_THEORY_CONTENT)
+_SP_GRAPH_THEORY_MD: Final[str] = _theory_section_markdown(SP_GRAPH_THEORY_CONTENT)
+_GRAPH_THEORY_MD: Final[str] = _theory_section_markdown(LAPLACIAN_THEORY_CONTENT)
+_HEURISTIC_THEORY_MD: Final[str] = _theory_section_markdown(HEURISTIC_THEORY_CONTENT)
+
+
+def _markdown_table(header: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    """Format a small static table as a GitHub-flavored markdown table."""
+    def row_md(cells: Sequence[Any]) -> str:
+        return "| " + " | ".join(str(cell).replace("|", "\\|") for cell in cells) + " |"
+    lines = [row_md(header), "|" + "---|" * len(header)]
+    lines.extend(row_md(row) for row in rows)
+    return "\n".join(lines)
+
+
+# Static tables as markdown, formatted once at import. They are tiny, so a
+# plain markdown table avoids shipping a DataFrame to the datagrid component.
+_EMPIRICAL_MD_TABLE: Final[str] = _markdown_table(
+    ENUMERATION_THEORY_CONTENT.empirical_header,
+    ENUMERATION_THEORY_CONTENT.empirical_rows,
+)
+_COMPARISON_MD_TABLE: Final[str] = _markdown_table(
+    METHOD_COMPARISON_CONTENT.comparison_header,
+    METHOD_COMPARISON_CONTENT.comparison_rows,
+)
+
+_ENUMERATION_THEORY_MD: Final[str] = "\n\n".join([
+    ENUMERATION_THEORY_CONTENT.explanation,
+    _H_FORMULAS,
+    _SECTION_FORMULAS_MD[ENUMERATION_THEORY_CONTENT.formulas],
+    "### Catalan Number Sequence",
+    f"```\n{_CATALAN_CODE_STR}\n```",
+    "### Empirical Topology Counts",
+    "*Actual counts from exhaustive enumeration in CapAssigner:*",
+    _EMPIRICAL_MD_TABLE,
+    ENUMERATION_THEORY_CONTENT.empirical_explanation,
+    ENUMERATION_THEORY_CONTENT.references,
+])
+_METHOD_COMPARISON_MD: Final[str] = "\n\n".join([
+    _COMPARISON_MD_TABLE,
+    METHOD_COMPARISON_CONTENT.recommendations,
+    "### Complexity Comparison",
+    METHOD_COMPARISON_CONTENT.complexity_comparison,
+])
+
+
+# Newer Streamlit versions can track whether an expander is open (key +
+# on_change), which lets collapsed theory sections skip rendering entirely.
+EXPANDER_OPEN_STATE_AVAILABLE = "on_change" in inspect.signature(st.expander).parameters
+
+
+def _theory_expander(label: str, key: str) -> Any:
+    """Create a collapsed theory expander that reruns when toggled.
+
+    When open-state tracking is available, the expander state is stored in
+    ``st.session_state[key]`` and opening it triggers a rerun that renders
+    the body.
+    """
+    if EXPANDER_OPEN_STATE_AVAILABLE:
+        return st.expander(label, expanded=False, key=key, on_change="rerun")
+    return st.expander(label, expanded=False)
+
+
+def _is_open(expander: Any) -> bool:
+    """Return whether an expander body should be rendered.
+
+    Falls back to True when the Streamlit version does not report the
+    open state, so content is always rendered there.
+    """
+    return getattr(expander, "open", None) is not False
+
+
+def _render_theory(title: str, body: str, key: str) -> None:
+    """Render a theory expander whose body is pre-assembled markdown.
+
+    Args:
+        title: Expander label.
+        body: Markdown body (may contain $$...$$ math and HTML captions).
+        key: Session-state key tracking whether the expander is open.
+    """
+    with _theory_expander(title, key=key) as expander:
+        if _is_open(expander):
+            st.markdown(body, unsafe_allow_html=True)
 
 
 def show_sp_theory() -> None:
@@ -377,40 +607,14 @@ def show_sp_theory() -> None:
     Renders the SP theory content in a Streamlit expander with
     LaTeX formulas and explanations.
     """
-    content = get_sp_theory_content()
-    
-    with st.expander(f"📚 {content['title']}", expanded=False):
-        st.markdown(content['explanation'])
-        
-        st.markdown("### Key Formulas")
-        for latex, description in content['formulas']:
-            st.latex(latex)
-            st.caption(description)
-        
-        st.markdown("### When to Use")
-        st.markdown(content['when_to_use'])
-        
-        st.markdown("### Complexity")
-        st.markdown(content['complexity'])
+    _render_theory(f"📚 {SP_THEORY_CONTENT.title}", _SP_THEORY_MD, key="sp_theory_expander")
 
 
 def show_sp_graph_theory() -> None:
     """Display theory section for SP Graph Exhaustive method."""
-    content = get_sp_graph_theory_content()
-    
-    with st.expander(f"📚 {content['title']}", expanded=False):
-        st.markdown(content['explanation'])
-        
-        st.markdown("### Key Formulas")
-        for latex, description in content['formulas']:
-            st.latex(latex)
-            st.caption(description)
-        
-        st.markdown("### When to Use")
-        st.markdown(content['when_to_use'])
-        
-        st.markdown("### Complexity")
-        st.markdown(content['complexity'])
+    _render_theory(
+        f"📚 {SP_GRAPH_THEORY_CONTENT.title}", _SP_GRAPH_THEORY_MD, key="sp_graph_theory_expander"
+    )
 
 
 def show_graph_theory() -> None:
@@ -419,21 +623,7 @@ def show_graph_theory() -> None:
     Renders the Laplacian theory content explaining nodal analysis,
     admittance matrices, and boundary conditions.
     """
-    content = get_laplacian_theory_content()
-    
-    with st.expander(f"📚 {content['title']}", expanded=False):
-        st.markdown(content['explanation'])
-        
-        st.markdown("### Key Formulas")
-        for latex, description in content['formulas']:
-            st.latex(latex)
-            st.caption(description)
-        
-        st.markdown("### When to Use")
-        st.markdown(content['when_to_use'])
-        
-        st.markdown("### Complexity")
-        st.markdown(content['complexity'])
+    _render_theory(f"📚 {LAPLACIAN_THEORY_CONTENT.title}", _GRAPH_THEORY_MD, key="graph_theory_expander")
 
 
 def show_heuristic_theory() -> None:
@@ -442,21 +632,9 @@ def show_heuristic_theory() -> None:
     Renders the heuristic theory content explaining random exploration,
     deterministic seeding, and probabilistic guarantees.
     """
-    content = get_heuristic_theory_content()
-    
-    with st.expander(f"📚 {content['title']}", expanded=False):
-        st.markdown(content['explanation'])
-        
-        st.markdown("### Key Formulas")
-        for latex, description in content['formulas']:
-            st.latex(latex)
-            st.caption(description)
-        
-        st.markdown("### When to Use")
-        st.markdown(content['when_to_use'])
-        
-        st.markdown("### Complexity")
-        st.markdown(content['complexity'])
+    _render_theory(
+        f"📚 {HEURISTIC_THEORY_CONTENT.title}", _HEURISTIC_THEORY_MD, key="heuristic_theory_expander"
+    )
 
 
 def show_enumeration_theory() -> None:
@@ -465,34 +643,10 @@ def show_enumeration_theory() -> None:
     Renders educational content about how SP topology enumeration works,
     the connection to Catalan numbers, and academic references.
     """
-    import pandas as pd
-    
-    content = get_enumeration_theory_content()
-    
-    with st.expander(f"🔢 {content['title']}", expanded=False):
-        st.markdown(content['explanation'])
-        
-        st.markdown("### Key Formulas")
-        for latex, description in content['formulas']:
-            st.latex(latex)
-            st.caption(description)
-        
-        # Catalan sequence display
-        st.markdown("### Catalan Number Sequence")
-        catalan_str = ", ".join([f"C({n})={c}" for n, c in content['catalan_sequence']])
-        st.code(catalan_str, language=None)
-        
-        # Empirical data table
-        st.markdown("### Empirical Topology Counts")
-        st.markdown("*Actual counts from exhaustive enumeration in CapAssigner:*")
-        df = pd.DataFrame(content['empirical_data'])
-        st.dataframe(df, use_container_width=True, hide_index=True)
-        
-        # Explanation of empirical values
-        st.markdown(content['empirical_explanation'])
-        
-        # Academic references
-        st.markdown(content['references'])
+    _render_theory(
+        f"🔢 {ENUMERATION_THEORY_CONTENT.title}", _ENUMERATION_THEORY_MD,
+        key="enumeration_theory_expander",
+    )
 
 
 def show_method_comparison() -> None:
@@ -501,33 +655,15 @@ def show_method_comparison() -> None:
     Renders a comparison table and recommendations for choosing
     between synthesis methods.
     """
-    import pandas as pd
-    
-    content = get_method_comparison_content()
-    
-    with st.expander(f"🔄 {content['title']}", expanded=False):
-        # Display comparison table
-        df = pd.DataFrame(content['comparison_table'])
-        st.dataframe(df, use_container_width=True, hide_index=True)
-        
-        # Display recommendations
-        st.markdown(content['recommendations'])
-        
-        # Display complexity comparison
-        st.markdown("### Complexity Comparison")
-        st.markdown(content['complexity_comparison'])
-
-
-def get_sp_vs_graph_limitations_content() -> Dict[str, Any]:
-    """Get detailed content explaining SP algorithm limitations and when graph methods are needed.
+    _render_theory(
+        f"🔄 {METHOD_COMPARISON_CONTENT.title}", _METHOD_COMPARISON_MD,
+        key="method_comparison_expander",
+    )
 
-    Returns:
-        Dictionary with comprehensive explanation of SP vs Graph topologies,
-        including the classroom 4-capacitor example that cannot be solved by SP enumeration.
-    """
-    return {
-        "title": "⚠️ SP Algorithm Limitations: When Pure SP is Not Enough",
-        "introduction": """
+
+SP_VS_GRAPH_LIMITATIONS_CONTENT: Final[Mapping[str, str]] = MappingProxyType({
+    "title": "⚠️ SP Algorithm Limitations: When Pure SP is Not Enough",
+    "introduction": """
 **CRITICAL UNDERSTANDING**: Not all capacitor networks can be represented as pure Series-Parallel (SP) topologies!
 
 The SP enumeration algorithm in CapAssigner is designed to generate **binary tree structures**
@@ -535,7 +671,7 @@ where each capacitor appears **exactly once** in the tree. This works perfectly
 practical circuits, but it has a fundamental limitation: **it cannot generate graph topologies
 with internal nodes** where the same capacitor value needs to appear multiple times.
 """,
-        "sp_tree_structure": """
+    "sp_tree_structure": """
 ### What is a Series-Parallel Tree?
 
 An SP tree is a **binary tree** where:
@@ -559,7 +695,7 @@ This represents: C1 in series with (C2 || C3)
 
 **Key constraint**: Each capacitor index (C1, C2, C3) appears **exactly once** in the tree.
 """,
-        "graph_topology_structure": """
+    "graph_topology_structure": """
 ### What is a General Graph Topology?
 
 A graph topology allows:
@@ -587,7 +723,7 @@ In this topology:
 is used to create three parallel paths in the network topology, which the graph-based Laplacian
 method can model correctly.
 """,
-        "classroom_example": """
+    "classroom_example": """
 ### Case Study: The Classroom 4-Capacitor Problem
 
 **Given capacitors**: C₁=2pF, C₂=3pF, C₃=3pF, C₄=1pF  
@@ -633,7 +769,7 @@ This topology **cannot be represented as an SP tree** because:
 limitation of the SP algorithm design. The correct solution requires graph topology with
 internal nodes.
 """,
-        "when_sp_fails": """
+    "when_sp_fails": """
 ### When Does SP Enumeration Fail?
 
 SP enumeration **cannot find exact solutions** for:
@@ -656,7 +792,7 @@ SP enumeration **cannot find exact solutions** for:
 5. **Mesh networks**
    - Multiple closed loops that cannot be broken down into series/parallel
 """,
-        "solution_strategy": """
+    "solution_strategy": """
 ### Recommended Solution Strategy
 
 When SP enumeration doesn't find an acceptable solution:
@@ -704,7 +840,7 @@ ceq, warning = calculate_graph_ceq(G, terminal_a='A', terminal_b='B')
 print(f"C_eq = {ceq*1e12:.3f} pF")  # Output: C_eq = 1.000 pF
 ```
 """,
-        "algorithm_flowchart": """
+    "algorithm_flowchart": """
 ### Decision Flowchart: Which Algorithm to Use?
 
 ```
@@ -734,7 +870,7 @@ START: Need to find C_eq for capacitor network
   |                   - seed: set for reproducibility
 ```
 """,
-        "key_takeaways": """
+    "key_takeaways": """
 ### Key Takeaways
 
 1. **SP enumeration is NOT broken** — it works exactly as designed for SP tree topologies
@@ -756,7 +892,17 @@ START: Need to find C_eq for capacitor network
 7. **Tool selection matters** — using the wrong algorithm for your problem type wastes time
    or produces suboptimal results
 """
-    }
+})
+
+
+def get_sp_vs_graph_limitations_content() -> Mapping[str, str]:
+    """Get detailed content explaining SP algorithm limitations and when graph methods are needed.
+
+    Returns:
+        Read-only mapping with comprehensive explanation of SP vs Graph topologies,
+        including the classroom 4-capacitor example that cannot be solved by SP enumeration.
+    """
+    return SP_VS_GRAPH_LIMITATIONS_CONTENT
 
 
 def show_sp_vs_graph_limitations() -> None:
@@ -769,50 +915,71 @@ def show_sp_vs_graph_limitations() -> None:
     - Decision flowchart for algorithm selection
     - Worked example with the classroom 4-capacitor problem
     """
-    content = get_sp_vs_graph_limitations_content()
+    c = get_sp_vs_graph_limitations_content()
     
-    with st.expander(f"{content['title']}", expanded=False):
-        st.markdown(content['introduction'])
-        
-        st.markdown(content['sp_tree_structure'])
-        
-        st.markdown(content['graph_topology_structure'])
-        
-        st.markdown("---")
-        st.markdown(content['classroom_example'])
-        
-        st.markdown("---")
-        st.markdown(content['when_sp_fails'])
-        
-        st.markdown("---")
-        st.markdown(content['solution_strategy'])
-        
+    with _theory_expander(c['title'], key="sp_limitations_expander") as expander:
+        if not _is_open(expander):
+            return
+        st.markdown(_LIMITATIONS_MD)
         st.markdown("---")
-        st.markdown(content['algorithm_flowchart'])
-        
-        st.markdown("---")
-        st.info(content['key_takeaways'])
+        st.info(c['key_takeaways'])
+
+
+# st.fragment (Streamlit 1.37+) reruns only the decorated function when its
+# own widgets change; on older versions the function is left undecorated.
+_fragment = getattr(st, "fragment", lambda func: func)
 
 
+@_fragment
 def show_all_theory_sections() -> None:
     """Display all theory sections before method selection (T075).
 
     This function should be called in pages.py to render all
-    educational content expanders.
+    educational content as collapsible sections.
     """
     st.markdown("### 📖 Theory & Background")
     st.caption("Expand sections below to learn about each synthesis method.")
     
-    # Show comprehensive SP limitations first (most important for users)
-    show_sp_vs_graph_limitations()
-    
-    # Then show individual method theories
-    show_sp_theory()
-    show_sp_graph_theory()
-    show_graph_theory()
-    show_heuristic_theory()
-    show_enumeration_theory()
-    show_method_comparison()
+    # All sections are native <details> blocks in one cached element, so
+    # expanding/collapsing happens client-side without a rerun.
+    st.markdown(_ALL_THEORY_HTML, unsafe_allow_html=True)
+
+
+def _details(summary: str, body: str) -> str:
+    """Wrap a markdown body in a collapsible HTML <details> block."""
+    return (
+        f"<details>\n<summary>{html.escape(summary, quote=False)}</summary>\n\n"
+        f"{body}\n\n</details>"
+    )
+
+
+# SP limitations body (everything but the key takeaways), pre-joined so the
+# expander sends a single st.markdown element instead of one per paragraph
+_LIMITATIONS_MD: Final[str] = "\n\n---\n\n".join([
+    "\n\n".join([
+        SP_VS_GRAPH_LIMITATIONS_CONTENT['introduction'],
+        SP_VS_GRAPH_LIMITATIONS_CONTENT['sp_tree_structure'],
+        SP_VS_GRAPH_LIMITATIONS_CONTENT['graph_topology_structure'],
+    ]),
+    SP_VS_GRAPH_LIMITATIONS_CONTENT['classroom_example'],
+    SP_VS_GRAPH_LIMITATIONS_CONTENT['when_sp_fails'],
+    SP_VS_GRAPH_LIMITATIONS_CONTENT['solution_strategy'],
+    SP_VS_GRAPH_LIMITATIONS_CONTENT['algorithm_flowchart'],
+])
+
+# All theory sections as one markdown/HTML blob of <details> blocks, built at
+# import: comprehensive SP limitations first (most important for users), then
+# the individual method theories
+_ALL_THEORY_HTML: Final[str] = "\n\n".join([
+    _details(SP_VS_GRAPH_LIMITATIONS_CONTENT['title'], "\n\n---\n\n".join([
+        _LIMITATIONS_MD, SP_VS_GRAPH_LIMITATIONS_CONTENT['key_takeaways']])),
+    _details(f"📚 {SP_THEORY_CONTENT.title}", _SP_THEORY_MD),
+    _details(f"📚 {SP_GRAPH_THEORY_CONTENT.title}", _SP_GRAPH_THEORY_MD),
+    _details(f"📚 {LAPLACIAN_THEORY_CONTENT.title}", _GRAPH_THEORY_MD),
+    _details(f"📚 {HEURISTIC_THEORY_CONTENT.title}", _HEURISTIC_THEORY_MD),
+    _details(f"🔢 {ENUMERATION_THEORY_CONTENT.title}", _ENUMERATION_THEORY_MD),
+    _details(f"🔄 {METHOD_COMPARISON_CONTENT.title}", _METHOD_COMPARISON_MD),
+])
 
 
 def show_formula(formula: str, description: str) -> None:
@@ -822,5 +989,15 @@ def show_formula(formula: str, description: str) -> None:
         formula: LaTeX formula string (without $$ delimiters).
         description: Plain text description of the formula.
     """
-    st.latex(formula)
-    st.caption(description)
+    block = _FORMULA_BLOCKS.get((formula, description)) or _formula_markdown(formula, description)
+    st.markdown(block, unsafe_allow_html=True)
+
+
+def show_formulas(formulas: Sequence[Tuple[str, str]]) -> None:
+    """Display several formulas with descriptions as one markdown element.
+
+    Args:
+        formulas: Sequence of (latex_string, description) pairs.
+    """
+    block = _SECTION_FORMULAS_MD.get(tuple(formulas)) or _formulas_markdown(formulas)
+    st.markdown(block, unsafe_allow_html=True)
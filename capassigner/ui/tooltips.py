@@ -8,8 +8,17 @@ Constitutional Compliance:
     - Principle III (Robust Input): Input format examples and constraints
 """
 
+import textwrap
+from functools import lru_cache
+
+
+def _normalize(text: str) -> str:
+    """Dedent and strip tooltip markdown once at import."""
+    return textwrap.dedent(text).strip()
+
+
 # Capacitor input tooltips
-TOOLTIP_CAP_LIST = """
+TOOLTIP_CAP_LIST = _normalize("""
 **Enter capacitor values, one per line or comma-separated.**
 
 **Supported formats:**
@@ -24,9 +33,9 @@ TOOLTIP_CAP_LIST = """
 1e-12
 100nF
 ```
-"""
+""")
 
-TOOLTIP_CAP_TARGET = """
+TOOLTIP_CAP_TARGET = _normalize("""
 **Target equivalent capacitance to achieve.**
 
 **Supported formats:**
@@ -38,9 +47,9 @@ TOOLTIP_CAP_TARGET = """
 
 The synthesis algorithm will find capacitor networks
 with equivalent capacitance as close as possible to this target.
-"""
+""")
 
-TOOLTIP_TOLERANCE = """
+TOOLTIP_TOLERANCE = _normalize("""
 **Acceptable error percentage (±).**
 
 Solutions with relative error ≤ tolerance will be marked as "within tolerance".
@@ -49,17 +58,17 @@ Solutions with relative error ≤ tolerance will be marked as "within tolerance"
 - Example: 5% means solutions within ±5% of target are acceptable
 
 **Note:** This does not filter results, only marks which solutions meet the tolerance.
-"""
+""")
 
 # Method selection tooltips
-TOOLTIP_METHOD_SIMPLE = """
+TOOLTIP_METHOD_SIMPLE = _normalize("""
 **Fast two-level series-parallel combinations.**
 
 Quick approximations suitable for any number of capacitors.
 Limited to simple topologies.
-"""
+""")
 
-TOOLTIP_METHOD_SP_TREE = """
+TOOLTIP_METHOD_SP_TREE = _normalize("""
 **SP Tree Exhaustive - Series-Parallel Enumeration**
 
 Exhaustively enumerates ALL possible series-parallel binary trees.
@@ -68,9 +77,9 @@ Exhaustively enumerates ALL possible series-parallel binary trees.
 - ⚠️ **Slow for N > 8** (Catalan × N! complexity)
 - ⚠️ **Cannot find internal nodes** (pure series/parallel only)
 - 📐 Topologies: Binary trees with series/parallel operations
-"""
+""")
 
-TOOLTIP_METHOD_SP_GRAPH = """
+TOOLTIP_METHOD_SP_GRAPH = _normalize("""
 **SP Graph Exhaustive - Graph Enumeration**
 
 Enumerates all connected multigraphs and checks for SP-reducibility.
@@ -79,9 +88,9 @@ Enumerates all connected multigraphs and checks for SP-reducibility.
 - ✅ **Solves Classroom Problem** (e.g., [3,2,3,1] -> 1)
 - ⚠️ **Very Slow for N > 6** (Super-exponential)
 - 📐 Topologies: General graphs that are SP-reducible
-"""
+""")
 
-TOOLTIP_METHOD_HEURISTIC = """
+TOOLTIP_METHOD_HEURISTIC = _normalize("""
 **Heuristic Graph Search - Random Exploration**
 
 Randomly generates graph topologies including non-SP networks
@@ -91,9 +100,9 @@ Randomly generates graph topologies including non-SP networks
 - ✅ Discovers **non-SP solutions**
 - ⚠️ **No optimality guarantee** (probabilistic)
 - 🎲 **Deterministic** with seed parameter
-"""
+""")
 
-TOOLTIP_MAX_N_SP = """
+TOOLTIP_MAX_N_SP = _normalize("""
 **Maximum capacitors for SP Exhaustive enumeration.**
 
 Higher values dramatically increase computation time.
@@ -103,10 +112,10 @@ Higher values dramatically increase computation time.
 - N>8: Not recommended (use Heuristic instead)
 
 **Constitutional default:** 8
-"""
+""")
 
 # Heuristic parameters
-TOOLTIP_HEURISTIC_ITERS = """
+TOOLTIP_HEURISTIC_ITERS = _normalize("""
 **Number of random graph topologies to explore.**
 
 More iterations = higher probability of finding optimal solution.
@@ -117,9 +126,9 @@ More iterations = higher probability of finding optimal solution.
 
 **Trade-off:** More iterations = longer execution time.
 **Constitutional default:** 2000
-"""
+""")
 
-TOOLTIP_HEURISTIC_INTERNAL = """
+TOOLTIP_HEURISTIC_INTERNAL = _normalize("""
 **Maximum internal nodes (besides terminals A and B).**
 
 Internal nodes allow more complex topologies:
@@ -130,9 +139,9 @@ Internal nodes allow more complex topologies:
 
 **Trade-off:** More nodes = larger search space.
 **Constitutional default:** 2
-"""
+""")
 
-TOOLTIP_SEED = """
+TOOLTIP_SEED = _normalize("""
 **Random seed for reproducible results.**
 
 Using the same seed with identical inputs produces identical results.
@@ -142,52 +151,57 @@ Using the same seed with identical inputs produces identical results.
 
 **Use case:** Set a seed to share and reproduce exact results.
 **Constitutional default:** 0
-"""
+""")
 
 # UI appearance
-TOOLTIP_UI_SCALE = """
+TOOLTIP_UI_SCALE = _normalize("""
 **Global UI scaling factor.**
 
 Adjusts text size and widget dimensions.
-"""
+""")
 
-TOOLTIP_DIAGRAM_SCALE = """
+TOOLTIP_DIAGRAM_SCALE = _normalize("""
 **Scaling factor for circuit diagrams and graphs.**
 
 Larger values = bigger visualizations.
-"""
+""")
 
 # Results tooltips
-TOOLTIP_RESULTS_CEQ = """
+TOOLTIP_RESULTS_CEQ = _normalize("""
 **Equivalent capacitance of the network topology.**
 
 Calculated using:
 - **SP topologies**: Series/parallel formulas
 - **Graph topologies**: Laplacian nodal analysis
-"""
+""")
 
-TOOLTIP_RESULTS_ERROR = """
+TOOLTIP_RESULTS_ERROR = _normalize("""
 **Absolute error = |C_eq - C_target|**
 
 The difference between achieved and target capacitance.
-"""
+""")
 
-TOOLTIP_RESULTS_REL_ERROR = """
+TOOLTIP_RESULTS_REL_ERROR = _normalize("""
 **Relative error = |C_eq - C_target| / C_target × 100%**
 
 Percentage deviation from target. Lower is better.
-"""
+""")
 
 
-TOOLTIP_METHOD_SELECTOR = """
+TOOLTIP_METHOD_SELECTOR = _normalize("""
 **Select the synthesis algorithm.**
 
 - **SP Tree Exhaustive**: Fast, exact for standard series-parallel circuits. Best for N <= 8.
 - **SP Graph Exhaustive**: Exact for all SP-reducible circuits, including those with internal nodes (bridges). Slower, best for N <= 6.
 - **Heuristic Graph Search**: Approximate, finds non-SP solutions (bridges). Best for N > 8 or complex targets.
-"""
+""")
+
+
+# All tooltip constants by name, collected once at import
+_TOOLTIPS = {name: text for name, text in list(globals().items()) if name.startswith("TOOLTIP_")}
 
 
+@lru_cache(maxsize=128)
 def get_tooltip(key: str) -> str:
     """Retrieve tooltip text by key.
 
@@ -208,4 +222,4 @@ def get_tooltip(key: str) -> str:
     if not key.startswith("TOOLTIP_"):
         key = f"TOOLTIP_{key}"
     
-    return globals().get(key, "")
+    return _TOOLTIPS.get(key, "")
@@ -18,23 +18,42 @@ import sys
 import platform
 import subprocess
 import shutil
+from functools import cache
 from pathlib import Path
 
 
+@cache
+def _system():
+    """Return platform.system(), computed once."""
+    return platform.system()
+
+
+@cache
+def _os_info():
+    """Return the lowercased contents of /etc/os-release, read once."""
+    try:
+        with open('/etc/os-release') as f:
+            return f.read().lower()
+    except FileNotFoundError:
+        return ""
+
+
 def check_pdflatex():
     """Check if pdflatex is already installed."""
     return shutil.which('pdflatex') is not None
 
 
 def run_command(cmd, shell=False, check=True):
-    """Run a shell command and return success status."""
+    """Run a shell command and return success status.
+
+    Output is not captured: package managers can print a lot during a TeX
+    install, so it streams straight to the terminal as progress.
+    """
     try:
         result = subprocess.run(
             cmd,
             shell=shell,
-            check=check,
-            capture_output=True,
-            text=True
+            check=check
         )
         return result.returncode == 0
     except subprocess.CalledProcessError as e:
@@ -46,14 +65,8 @@ def run_command(cmd, shell=False, check=True):
 
 def install_linux():
     """Install LaTeX on Linux."""
-    system = platform.system()
-    
     # Detect Linux distribution
-    try:
-        with open('/etc/os-release') as f:
-            os_info = f.read().lower()
-    except FileNotFoundError:
-        os_info = ""
+    os_info = _os_info()
     
     if 'debian' in os_info or 'ubuntu' in os_info:
         print("Detected Debian/Ubuntu...")
@@ -162,7 +175,7 @@ def main():
         return 1
     
     # Detect OS and install
-    system = platform.system()
+    system = _system()
     
     print(f"\nDetected OS: {system}")
     print("Attempting to install LaTeX...\n")
@@ -13,6 +13,8 @@ Constitutional Compliance:
 from __future__ import annotations
 import pytest
 import inspect
+from dataclasses import fields
+from functools import lru_cache
 from typing import get_type_hints
 
 # Import all public APIs
@@ -58,41 +60,42 @@ from capassigner.core.parsing import (
 )
 
 
+@lru_cache(maxsize=None)
+def _params(func) -> frozenset:
+    """Parameter names of func, introspected once per function."""
+    return frozenset(inspect.signature(func).parameters)
+
+
 class TestSPStructuresAPIContract:
     """Verify SP structures public API remains stable."""
 
     def test_leaf_has_required_attributes(self):
         """Verify Leaf has capacitor_index and value."""
         leaf = Leaf(capacitor_index=0, value=5e-12)
-        assert hasattr(leaf, 'capacitor_index')
-        assert hasattr(leaf, 'value')
+        assert {f.name for f in fields(leaf)} >= {'capacitor_index', 'value'}
 
     def test_series_has_left_right(self):
         """Verify Series has left and right children."""
         c1 = Leaf(0, 5e-12)
         c2 = Leaf(1, 10e-12)
         series = Series(left=c1, right=c2)
-        assert hasattr(series, 'left')
-        assert hasattr(series, 'right')
+        assert {f.name for f in fields(series)} >= {'left', 'right'}
 
     def test_parallel_has_left_right(self):
         """Verify Parallel has left and right children."""
         c1 = Leaf(0, 5e-12)
         c2 = Leaf(1, 10e-12)
         parallel = Parallel(left=c1, right=c2)
-        assert hasattr(parallel, 'left')
-        assert hasattr(parallel, 'right')
+        assert {f.name for f in fields(parallel)} >= {'left', 'right'}
 
     def test_calculate_sp_ceq_signature(self):
         """Verify calculate_sp_ceq accepts SPNode and returns float."""
-        sig = inspect.signature(calculate_sp_ceq)
-        params = list(sig.parameters.keys())
+        params = _params(calculate_sp_ceq)
         assert 'node' in params
 
     def test_sp_node_to_expression_signature(self):
         """Verify sp_node_to_expression accepts node and labels."""
-        sig = inspect.signature(sp_node_to_expression)
-        params = list(sig.parameters.keys())
+        params = _params(sp_node_to_expression)
         assert 'node' in params
         assert 'capacitor_labels' in params
 
@@ -102,16 +105,14 @@ class TestSPEnumerationAPIContract:
 
     def test_enumerate_sp_topologies_signature(self):
         """Verify enumerate_sp_topologies accepts capacitors list."""
-        sig = inspect.signature(enumerate_sp_topologies)
-        params = list(sig.parameters.keys())
+        params = _params(enumerate_sp_topologies)
         assert 'capacitors' in params
         # Optional progress callback
         assert 'progress_cb' in params
 
     def test_find_best_sp_solutions_signature(self):
         """Verify find_best_sp_solutions has required parameters."""
-        sig = inspect.signature(find_best_sp_solutions)
-        params = list(sig.parameters.keys())
+        params = _params(find_best_sp_solutions)
         assert 'capacitors' in params
         assert 'target' in params
         assert 'tolerance' in params
@@ -132,10 +133,12 @@ class TestGraphsAPIContract:
             terminal_b='B',
             internal_nodes=[]
         )
-        assert hasattr(topology, 'graph')
-        assert hasattr(topology, 'terminal_a')
-        assert hasattr(topology, 'terminal_b')
-        assert hasattr(topology, 'internal_nodes')
+        assert {f.name for f in fields(topology)} >= {
+            'graph',
+            'terminal_a',
+            'terminal_b',
+            'internal_nodes',
+        }
 
     def test_calculate_graph_ceq_returns_tuple(self):
         """Verify calculate_graph_ceq returns (ceq, warning) tuple."""
@@ -155,8 +158,7 @@ class TestHeuristicsAPIContract:
 
     def test_generate_random_graph_signature(self):
         """Verify generate_random_graph has required parameters."""
-        sig = inspect.signature(generate_random_graph)
-        params = list(sig.parameters.keys())
+        params = _params(generate_random_graph)
         assert 'capacitors' in params
         assert 'max_internal_nodes' in params
         assert 'seed' in params
@@ -164,8 +166,7 @@ class TestHeuristicsAPIContract:
 
     def test_heuristic_search_signature(self):
         """Verify heuristic_search has required parameters."""
-        sig = inspect.signature(heuristic_search)
-        params = list(sig.parameters.keys())
+        params = _params(heuristic_search)
         assert 'capacitors' in params
         assert 'target' in params
         assert 'iterations' in params
@@ -189,13 +190,15 @@ class TestMetricsAPIContract:
             within_tolerance=True,
             expression="C1"
         )
-        assert hasattr(solution, 'topology')
-        assert hasattr(solution, 'ceq')
-        assert hasattr(solution, 'target')
-        assert hasattr(solution, 'absolute_error')
-        assert hasattr(solution, 'relative_error')
-        assert hasattr(solution, 'within_tolerance')
-        assert hasattr(solution, 'expression')
+        assert {f.name for f in fields(solution)} >= {
+            'topology',
+            'ceq',
+            'target',
+            'absolute_error',
+            'relative_error',
+            'within_tolerance',
+            'expression',
+        }
 
     def test_progress_update_has_required_fields(self):
         """Verify ProgressUpdate has all required fields."""
@@ -204,10 +207,7 @@ class TestMetricsAPIContract:
             total=100,
             message="Testing..."
         )
-        assert hasattr(update, 'current')
-        assert hasattr(update, 'total')
-        assert hasattr(update, 'message')
-        assert hasattr(update, 'best_error')  # Optional
+        assert {f.name for f in fields(update)} >= {'current', 'total', 'message', 'best_error'}
 
 
 class TestParsingAPIContract:
@@ -216,9 +216,7 @@ class TestParsingAPIContract:
     def test_parsed_capacitance_has_required_fields(self):
         """Verify ParsedCapacitance has success, value, error_message."""
         result = parse_capacitance("5pF")
-        assert hasattr(result, 'success')
-        assert hasattr(result, 'value')
-        assert hasattr(result, 'error_message')
+        assert {f.name for f in fields(result)} >= {'success', 'value', 'error_message'}
 
     def test_parse_capacitance_returns_parsed_capacitance(self):
         """Verify parse_capacitance returns ParsedCapacitance."""
@@ -234,21 +232,21 @@ class TestParsingAPIContract:
 class TestInputValidationContract:
     """Contract tests for input validation (ValueError for invalid inputs)."""
 
-    @pytest.mark.parametrize("invalid_capacitors", [
-        [],  # Empty list
-        [5e-12, -10e-12],  # Negative value
-        [5e-12, 0.0],  # Zero value
-    ])
-    def test_enumerate_sp_topologies_rejects_invalid_input(self, invalid_capacitors):
+    def test_enumerate_sp_topologies_rejects_invalid_input(self):
         """Verify enumerate_sp_topologies raises ValueError for invalid input."""
-        with pytest.raises(ValueError):
-            enumerate_sp_topologies(invalid_capacitors)
-
-    @pytest.mark.parametrize("invalid_target", [0.0, -5e-12])
-    def test_find_best_sp_solutions_rejects_invalid_target(self, invalid_target):
+        for invalid_capacitors in (
+            [],  # Empty list
+            [5e-12, -10e-12],  # Negative value
+            [5e-12, 0.0],  # Zero value
+        ):
+            with pytest.raises(ValueError):
+                enumerate_sp_topologies(invalid_capacitors)
+
+    def test_find_best_sp_solutions_rejects_invalid_target(self):
         """Verify find_best_sp_solutions raises ValueError for invalid target."""
-        with pytest.raises(ValueError, match="Target"):
-            find_best_sp_solutions([5e-12, 10e-12], target=invalid_target)
+        for invalid_target in (0.0, -5e-12):
+            with pytest.raises(ValueError, match="Target"):
+                find_best_sp_solutions([5e-12, 10e-12], target=invalid_target)
 
     def test_find_best_sp_solutions_rejects_negative_tolerance(self):
         """Verify find_best_sp_solutions raises ValueError for negative tolerance."""
@@ -286,6 +284,12 @@ class TestInputValidationContract:
             Capacitor(index=0, value=0.0, label="C1")
 
 
+# Expected error values, built once and shared by the formula contracts
+_APPROX_02PF = pytest.approx(0.2e-12)
+_APPROX_2PF = pytest.approx(2.0e-12)
+_APPROX_10 = pytest.approx(10.0)
+
+
 class TestFormulaContract:
     """Contract tests for formula correctness (Principle I: Scientific Accuracy)."""
 
@@ -321,14 +325,14 @@ class TestFormulaContract:
 
     def test_error_formula_absolute(self):
         """Contract: Absolute error = |C_eq - C_target|."""
-        assert calculate_absolute_error(5.2e-12, 5.0e-12) == pytest.approx(0.2e-12)
-        assert calculate_absolute_error(3.0e-12, 5.0e-12) == pytest.approx(2.0e-12)
+        assert calculate_absolute_error(5.2e-12, 5.0e-12) == _APPROX_02PF
+        assert calculate_absolute_error(3.0e-12, 5.0e-12) == _APPROX_2PF
 
     def test_error_formula_relative(self):
         """Contract: Relative error = (|C_eq - C_target| / C_target) * 100."""
         # 5.5 vs 5.0 = 10% error
         result = calculate_relative_error(5.5e-12, 5.0e-12)
-        assert result == pytest.approx(10.0)
+        assert result == _APPROX_10
 
     def test_tolerance_check(self):
         """Contract: Within tolerance = relative_error <= tolerance."""
@@ -4,8 +4,13 @@ This module provides reusable test data, assertion helpers, and fixture
 definitions for the comprehensive unit test suite.
 """
 
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Union
 import math
+import re
+
+import numpy as np
 
 
 # =============================================================================
@@ -55,13 +60,14 @@ def assert_exact_match(actual: float, expected: float, description: str = "") ->
     Raises:
         AssertionError: If relative error exceeds EXACT tolerance
     """
-    if expected != 0:
-        rel_error = abs((actual - expected) / expected)
-    else:
-        rel_error = abs(actual)
-    
-    assert rel_error < ToleranceLevel.EXACT, (
-        f"{description}: rel_error={rel_error:.2e}, "
+    # abs_tol only matters when expected is 0; a fixed absolute tolerance
+    # would swallow picofarad-scale differences
+    assert math.isclose(
+        actual, expected,
+        rel_tol=ToleranceLevel.EXACT,
+        abs_tol=0.0 if expected else ToleranceLevel.EXACT,
+    ), (
+        f"{description}: rel_error={abs(actual - expected) / (abs(expected) or 1.0):.2e}, "
         f"actual={actual:.6e}, expected={expected:.6e}"
     )
 
@@ -79,13 +85,12 @@ def assert_approximate_match(actual: float, expected: float, description: str =
     Raises:
         AssertionError: If relative error exceeds APPROXIMATE tolerance
     """
-    if expected != 0:
-        rel_error = abs((actual - expected) / expected)
-    else:
-        rel_error = abs(actual)
-    
-    assert rel_error < ToleranceLevel.APPROXIMATE, (
-        f"{description}: rel_error={rel_error:.2e}, "
+    assert math.isclose(
+        actual, expected,
+        rel_tol=ToleranceLevel.APPROXIMATE,
+        abs_tol=0.0 if expected else ToleranceLevel.APPROXIMATE,
+    ), (
+        f"{description}: rel_error={abs(actual - expected) / (abs(expected) or 1.0):.2e}, "
         f"actual={actual:.6e}, expected={expected:.6e}"
     )
 
@@ -318,10 +323,10 @@ MEDIUM_REGRESSION_CASES = [
         "name": "ladder_4cap",
         "description": "Ladder network with 4 capacitors",
         "capacitors": [3e-12, 6e-12, 6e-12, 3e-12],
-        "target_ceq": 1e-12,  # Series(Parallel(3,6), Parallel(3,6)) = Series(2, 2) = 1pF
+        "target_ceq": 1e-12,  # Series(Series(3,6), Series(6,3)) = Series(2, 2) = 1pF
         "tolerance_pct": 0.00001,  # EXACT: < 0.00001%
-        "source": "Symmetric ladder: (3||6) = 2pF, then 2 series 2 = 1pF",
-        "expected_topology": "Series(Parallel(C1, C2), Parallel(C3, C4))",
+        "source": "Symmetric ladder: (3 series 6) = 2pF, then 2 series 2 = 1pF",
+        "expected_topology": "Series(Series(C1, C2), Series(C3, C4))",
         "category": "medium",
         "priority": "P2"
     },
@@ -470,13 +475,115 @@ REGRESSION_CASES: List[TestCaseDict] = (
     EDGE_REGRESSION_CASES
 )
 
-# Category mapping for filtering
-REGRESSION_BY_CATEGORY = {
-    "simple": SIMPLE_REGRESSION_CASES,
-    "medium": MEDIUM_REGRESSION_CASES,
-    "complex": COMPLEX_REGRESSION_CASES,
-    "edge": EDGE_REGRESSION_CASES,
-    "classroom": CLASSROOM_EXAMPLES,
-}
+_TOPOLOGY_TOKEN = re.compile(r"\s*(Series|Parallel|Leaf|C\d+|[(),])")
+
+
+@lru_cache(maxsize=None)
+def _eval_topology(expr: str, caps: Tuple[float, ...]) -> float:
+    """Evaluate an expected_topology string such as "Series(C1, Parallel(C2, C3))".
 
+    Ci refers to caps[i - 1]; Leaf(Ci) is the same as Ci.
 
+    Raises:
+        ValueError: If the expression is not a concrete SP form.
+    """
+    tokens = []
+    pos = 0
+    while pos < len(expr.rstrip()):
+        match = _TOPOLOGY_TOKEN.match(expr, pos)
+        if match is None:
+            raise ValueError(f"Unexpected text in topology {expr!r} at {pos}")
+        tokens.append(match.group(1))
+        pos = match.end()
+
+    def expect(token: str) -> None:
+        if not tokens or tokens.pop(0) != token:
+            raise ValueError(f"Expected {token!r} in topology {expr!r}")
+
+    def parse() -> float:
+        if not tokens:
+            raise ValueError(f"Truncated topology {expr!r}")
+        head = tokens.pop(0)
+        if head.startswith("C") and head[1:].isdigit():
+            return caps[int(head[1:]) - 1]
+        if head == "Leaf":
+            expect("(")
+            value = parse()
+            expect(")")
+            return value
+        if head in ("Series", "Parallel"):
+            expect("(")
+            left = parse()
+            expect(",")
+            right = parse()
+            expect(")")
+            if head == "Series":
+                return 1.0 / (1.0 / left + 1.0 / right)
+            return left + right
+        raise ValueError(f"Unexpected {head!r} in topology {expr!r}")
+
+    value = parse()
+    if tokens:
+        raise ValueError(f"Trailing tokens in topology {expr!r}")
+    return value
+
+
+def _is_concrete_topology(expr: str) -> bool:
+    """Return True for SP forms like "Series(C1, C2)" (not "Various", "Parallel(...)")."""
+    return expr.startswith(("Series(", "Parallel(", "Leaf(")) and "..." not in expr
+
+
+# Derive target_ceq from expected_topology where it is a concrete SP form, so
+# hand-computed constants cannot drift from the topology they describe. The
+# literals are kept, keyed by case name, for the consistency test in
+# test_fixtures_validation.
+_literal_targets: Dict[str, float] = {}
+for _case in REGRESSION_CASES:
+    if not _is_concrete_topology(_case.get("expected_topology", "")):
+        continue
+    _literal_targets[_case["name"]] = _case["target_ceq"]
+    _case["target_ceq"] = _eval_topology(
+        _case["expected_topology"], tuple(_case["capacitors"])
+    )
+del _case
+LITERAL_TARGET_CEQ: Mapping[str, float] = MappingProxyType(_literal_targets)
+
+# Category mapping for filtering (read-only view over tuples)
+REGRESSION_BY_CATEGORY: Mapping[str, Tuple[TestCaseDict, ...]] = MappingProxyType({
+    "simple": tuple(SIMPLE_REGRESSION_CASES),
+    "medium": tuple(MEDIUM_REGRESSION_CASES),
+    "complex": tuple(COMPLEX_REGRESSION_CASES),
+    "edge": tuple(EDGE_REGRESSION_CASES),
+    "classroom": tuple(CLASSROOM_EXAMPLES),
+})
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    """Mark a fixture array read-only so tests cannot mutate shared data."""
+    array.setflags(write=False)
+    return array
+
+
+# Column (SoA) view of REGRESSION_CASES for bulk checks; row i is case i.
+# Capacitor rows are NaN-padded to the largest case, with true lengths
+# in REGRESSION_CAPACITOR_COUNTS.
+REGRESSION_NAMES: Tuple[str, ...] = tuple(c["name"] for c in REGRESSION_CASES)
+REGRESSION_CAPACITOR_COUNTS = _readonly(np.fromiter(
+    (len(c["capacitors"]) for c in REGRESSION_CASES),
+    dtype=np.intp, count=len(REGRESSION_CASES),
+))
+REGRESSION_CAPACITORS = np.full(
+    (len(REGRESSION_CASES), REGRESSION_CAPACITOR_COUNTS.max()), np.nan
+)
+for _row, _case in enumerate(REGRESSION_CASES):
+    REGRESSION_CAPACITORS[_row, :len(_case["capacitors"])] = _case["capacitors"]
+del _row, _case
+_readonly(REGRESSION_CAPACITORS)
+REGRESSION_TARGET_CEQ = _readonly(np.fromiter(
+    (c["target_ceq"] for c in REGRESSION_CASES),
+    dtype=np.float64, count=len(REGRESSION_CASES),
+))
+REGRESSION_TOLERANCE_PCT = _readonly(np.fromiter(
+    (c["tolerance_pct"] for c in REGRESSION_CASES),
+    dtype=np.float64, count=len(REGRESSION_CASES),
+))
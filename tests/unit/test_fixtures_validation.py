@@ -4,9 +4,18 @@ This test file validates that the new test infrastructure (Phase 1-2)
 works correctly before proceeding with Phase 3 implementation.
 """
 
+import numpy as np
 import pytest
 from tests.unit.test_fixtures import (
+    LITERAL_TARGET_CEQ,
+    REGRESSION_CAPACITOR_COUNTS,
+    REGRESSION_CAPACITORS,
+    REGRESSION_CASES,
+    REGRESSION_NAMES,
+    REGRESSION_TARGET_CEQ,
+    REGRESSION_TOLERANCE_PCT,
     ToleranceLevel,
+    _eval_topology,
     assert_exact_match,
     assert_approximate_match,
     assert_within_tolerance,
@@ -58,6 +67,16 @@ class TestAssertionHelpers:
         with pytest.raises(AssertionError):
             assert_approximate_match(1.0, 1.0 + 1e-5, "outside tolerance")
 
+    def test_assert_exact_match_is_relative_at_picofarad_scale(self):
+        """Verify a 1% gap between picofarad values is not absorbed."""
+        with pytest.raises(AssertionError):
+            assert_exact_match(1.01e-12, 1e-12, "picofarad scale")
+
+    def test_assert_exact_match_rejects_nan(self):
+        """Verify NaN never matches."""
+        with pytest.raises(AssertionError):
+            assert_exact_match(float("nan"), 1.0, "nan")
+
     def test_assert_within_tolerance_custom_percentage(self):
         """Verify custom tolerance works correctly."""
         assert_within_tolerance(100.0, 105.0, 5.0, "5% tolerance")
@@ -131,12 +150,12 @@ class TestFixtureIntegration:
     def test_simple_caps_fixture(self, simple_caps):
         """Verify simple_caps fixture provides 2 capacitors."""
         assert len(simple_caps) == 2
-        assert simple_caps == [5e-12, 10e-12]
+        assert simple_caps == (5e-12, 10e-12)
 
     def test_sample_capacitors_fixture(self, sample_capacitors):
         """Verify sample_capacitors fixture provides 4 capacitors."""
         assert len(sample_capacitors) == 4
-        assert sample_capacitors == [1e-12, 2e-12, 5e-12, 10e-12]
+        assert sample_capacitors == (1e-12, 2e-12, 5e-12, 10e-12)
 
     def test_sample_graph_fixture(self, sample_graph):
         """Verify sample_graph fixture creates valid NetworkX graph."""
@@ -158,5 +177,61 @@ class TestFixtureIntegration:
         assert tolerance_levels.APPROXIMATE == 1e-6
 
 
+class TestRegressionColumns:
+    """Validate the column (SoA) view of REGRESSION_CASES."""
+
+    def test_columns_match_cases(self):
+        """Verify every column row mirrors its regression case."""
+        assert REGRESSION_NAMES == tuple(c["name"] for c in REGRESSION_CASES)
+        for row, case in enumerate(REGRESSION_CASES):
+            count = REGRESSION_CAPACITOR_COUNTS[row]
+            assert REGRESSION_CAPACITORS[row, :count].tolist() == case["capacitors"]
+            assert np.isnan(REGRESSION_CAPACITORS[row, count:]).all()
+            assert REGRESSION_TARGET_CEQ[row] == case["target_ceq"]
+            assert REGRESSION_TOLERANCE_PCT[row] == case["tolerance_pct"]
+
+    def test_columns_are_read_only(self):
+        """Verify shared fixture arrays cannot be mutated by tests."""
+        with pytest.raises(ValueError):
+            REGRESSION_TARGET_CEQ[0] = 0.0
+
+    def test_targets_reachable(self):
+        """Verify no target exceeds the all-parallel sum of its capacitors."""
+        total = np.nansum(REGRESSION_CAPACITORS, axis=1)
+        assert (REGRESSION_TARGET_CEQ > 0).all()
+        assert (REGRESSION_TARGET_CEQ <= total * (1 + REGRESSION_TOLERANCE_PCT / 100)).all()
+
+
+class TestTopologyEvaluation:
+    """Validate the expected_topology evaluator used to derive target_ceq."""
+
+    def test_nested_topology(self):
+        """Verify Series(C1, Parallel(C2, C3)) for 6, 3, 3 pF gives 3pF."""
+        ceq = _eval_topology("Series(C1, Parallel(C2, C3))", (6e-12, 3e-12, 3e-12))
+        assert_exact_match(ceq, 3e-12, "nested topology")
+
+    def test_leaf_topology(self):
+        """Verify Leaf(C1) evaluates to the capacitor itself."""
+        assert _eval_topology("Leaf(C1)", (7.5e-12,)) == 7.5e-12
+
+    @pytest.mark.parametrize(
+        "case",
+        [c for c in REGRESSION_CASES if c["name"] in LITERAL_TARGET_CEQ],
+        ids=lambda c: c["name"],
+    )
+    def test_literal_target_matches_topology(self, case):
+        """Verify each hand-computed target_ceq agrees with its expected_topology."""
+        literal = LITERAL_TARGET_CEQ[case["name"]]
+        assert_within_tolerance(
+            case["target_ceq"], literal, case["tolerance_pct"], case["expected_topology"]
+        )
+
+    @pytest.mark.parametrize("expr", ["Various", "Parallel(...)", "Series(C1)"])
+    def test_non_concrete_topology_rejected(self, expr):
+        """Verify placeholders and malformed forms raise ValueError."""
+        with pytest.raises(ValueError):
+            _eval_topology(expr, (1e-12, 2e-12))
+
+
 # Mark as fast tests since they validate infrastructure
 pytestmark = pytest.mark.fast
@@ -11,7 +11,13 @@ import networkx as nx
 import numpy as np
 
 from capassigner.core.graphs import (
+    SCIPY_AVAILABLE,
+    GraphLaplacianSolver,
     GraphTopology,
+    _indexed_edges,
+    _reduce_sp,
+    _solve_dense,
+    _solve_sparse,
     build_laplacian_matrix,
     is_connected_between_terminals,
     calculate_graph_ceq,
@@ -56,6 +62,11 @@ class TestGraphTopology:
         assert 'n1' in topology.internal_nodes
 
 
+def _max_abs(x):
+    """Largest absolute entry of x (a single max-reduction)."""
+    return np.abs(x).max()
+
+
 class TestBuildLaplacianMatrix:
     """Tests for build_laplacian_matrix function."""
 
@@ -71,11 +82,11 @@ class TestBuildLaplacianMatrix:
         assert L.shape == (2, 2)
         
         # Check symmetry
-        assert np.allclose(L, L.T)
+        assert _max_abs(L - L.T) == 0.0
         
         # Check row sums are zero (Laplacian property)
         row_sums = np.sum(L, axis=1)
-        assert np.allclose(row_sums, 0)
+        assert _max_abs(row_sums) <= 1e-12 * _max_abs(L)
         
         # Check diagonal is positive
         assert L[0, 0] > 0
@@ -93,11 +104,11 @@ class TestBuildLaplacianMatrix:
         assert L.shape == (3, 3)
         
         # Check symmetry
-        assert np.allclose(L, L.T)
+        assert _max_abs(L - L.T) == 0.0
         
         # Check row sums are zero
         row_sums = np.sum(L, axis=1)
-        assert np.allclose(row_sums, 0)
+        assert _max_abs(row_sums) <= 1e-12 * _max_abs(L)
 
     def test_missing_capacitance_attribute(self):
         """Test error when edge lacks capacitance attribute."""
@@ -256,6 +267,181 @@ class TestCalculateGraphCeq:
         with pytest.raises(ValueError, match="capacitance"):
             calculate_graph_ceq(G, 'A', 'B')
 
+    def test_repeated_network_tracks_value_changes(self):
+        """Test that reused solves still follow edited capacitances."""
+        G = nx.Graph()
+        G.add_edge('A', 'n1', capacitance=10e-12)
+        G.add_edge('n1', 'B', capacitance=10e-12)
+
+        first, _ = calculate_graph_ceq(G, 'A', 'B')
+        again, _ = calculate_graph_ceq(G, 'A', 'B')
+        G['n1']['B']['capacitance'] = 30e-12
+        changed, _ = calculate_graph_ceq(G, 'A', 'B')
+
+        assert first == again
+        assert abs(changed - 7.5e-12) < 1e-20
+
+
+class TestGraphLaplacianSolver:
+    """Tests for the reusable multi-terminal-pair solver."""
+
+    @pytest.fixture
+    def bridge(self):
+        G = nx.Graph()
+        G.add_edge('A', 'n1', capacitance=5e-12)
+        G.add_edge('A', 'n2', capacitance=10e-12)
+        G.add_edge('n1', 'n2', capacitance=1e-12)
+        G.add_edge('n1', 'B', capacitance=3e-12)
+        G.add_edge('n2', 'B', capacitance=2e-12)
+        return G
+
+    def test_matches_calculate_graph_ceq_for_all_pairs(self, bridge):
+        """Test every terminal pair against the per-call Laplacian solve."""
+        solver = GraphLaplacianSolver(bridge)
+        for a in bridge.nodes():
+            for b in bridge.nodes():
+                if a == b:
+                    continue
+                expected, _ = calculate_graph_ceq(bridge, a, b)
+                ceq, warning = solver.ceq(a, b)
+                assert abs(ceq - expected) / expected < 1e-10
+                assert warning is None
+
+    def test_solver_argument(self, bridge):
+        """Test that calculate_graph_ceq delegates to a given solver."""
+        solver = GraphLaplacianSolver(bridge)
+        assert calculate_graph_ceq(bridge, 'n1', 'B', solver=solver) == solver.ceq('n1', 'B')
+
+    def test_disconnected_pair(self):
+        """Test that terminals in different components give 0."""
+        G = nx.Graph()
+        G.add_edge('A', 'n1', capacitance=5e-12)
+        G.add_edge('B', 'n2', capacitance=5e-12)
+
+        assert GraphLaplacianSolver(G).ceq('A', 'B') == (0.0, "No path between A and B")
+
+    def test_unknown_terminal(self, bridge):
+        """Test error when a terminal is not in the graph."""
+        with pytest.raises(ValueError, match="Terminal 'C'"):
+            GraphLaplacianSolver(bridge).ceq('A', 'C')
+
+    def test_identical_terminals_rejected(self, bridge):
+        """Test error when both terminals are the same node."""
+        with pytest.raises(ValueError, match="different nodes"):
+            GraphLaplacianSolver(bridge).ceq('A', 'A')
+
+    @pytest.mark.skipif(not SCIPY_AVAILABLE, reason="SciPy not installed")
+    def test_large_network_uses_sparse_factorization(self):
+        """Test the splu path against per-call solves on a 76-node network."""
+        G = nx.Graph()
+        junctions = ['A'] + [f'j{k}' for k in range(24)] + ['B']
+        for k, (left, right) in enumerate(zip(junctions, junctions[1:])):
+            top, bottom = f't{k}', f'b{k}'
+            G.add_edge(left, top, capacitance=10e-12)
+            G.add_edge(left, bottom, capacitance=4e-12)
+            G.add_edge(top, bottom, capacitance=1e-12)
+            G.add_edge(top, right, capacitance=3e-12)
+            G.add_edge(bottom, right, capacitance=7e-12)
+
+        solver = GraphLaplacianSolver(G)
+
+        assert solver.lu is not None
+        assert solver.inverse.size == 0
+        for a, b in [('A', 'B'), ('t3', 'j10'), ('B', 'b0')]:
+            expected, _ = calculate_graph_ceq(G, a, b)
+            ceq, warning = solver.ceq(a, b)
+            assert abs(ceq - expected) / expected < 1e-10
+            assert warning is None
+
+
+class TestReduceSP:
+    """Tests for series/parallel elimination before the Laplacian solve."""
+
+    def test_series_parallel_network_reduces(self):
+        """Test A--[10pF]--n1 with n1--[4pF]--B parallel to n1--n2--B."""
+        G = nx.Graph()
+        G.add_edge('A', 'n1', capacitance=10e-12)
+        G.add_edge('n1', 'B', capacitance=4e-12)
+        G.add_edge('n1', 'n2', capacitance=2e-12)
+        G.add_edge('n2', 'B', capacitance=2e-12)
+
+        # 4pF || (2pF series 2pF) = 5pF, then series with 10pF
+        expected = 10e-12 * 5e-12 / 15e-12
+        assert abs(_reduce_sp(G, 'A', 'B') - expected) < 1e-24
+
+    def test_dangling_node_is_dropped(self):
+        """Test that a dead-end internal branch does not change C_eq."""
+        G = nx.Graph()
+        G.add_edge('A', 'B', capacitance=5e-12)
+        G.add_edge('B', 'n1', capacitance=7e-12)
+
+        assert _reduce_sp(G, 'A', 'B') == 5e-12
+
+    def test_self_loop_is_ignored(self):
+        """Test that a self-loop on a dangling node does not change C_eq."""
+        G = nx.Graph()
+        G.add_edge('A', 'B', capacitance=5e-12)
+        G.add_edge('A', 'n1', capacitance=2e-12)
+        G.add_edge('n1', 'n1', capacitance=1e-12)
+
+        assert _reduce_sp(G, 'A', 'B') == 5e-12
+        assert calculate_graph_ceq(G, 'A', 'B') == (5e-12, None)
+
+    def test_bridge_is_not_reducible(self):
+        """Test that a Wheatstone bridge is left to the Laplacian solve."""
+        G = nx.Graph()
+        G.add_edge('A', 'n1', capacitance=5e-12)
+        G.add_edge('A', 'n2', capacitance=10e-12)
+        G.add_edge('n1', 'n2', capacitance=1e-12)
+        G.add_edge('n1', 'B', capacitance=3e-12)
+        G.add_edge('n2', 'B', capacitance=2e-12)
+
+        assert _reduce_sp(G, 'A', 'B') is None
+
+
+@pytest.mark.skipif(not SCIPY_AVAILABLE, reason="SciPy not installed")
+class TestSparseSolve:
+    """Test the sparse solve used for large networks."""
+
+    def test_chain_of_balanced_bridges(self):
+        """Test that 25 balanced 10pF bridges in series give 10pF/25."""
+        G = nx.Graph()
+        junctions = ['A'] + [f'j{k}' for k in range(24)] + ['B']
+        for k, (left, right) in enumerate(zip(junctions, junctions[1:])):
+            top, bottom = f't{k}', f'b{k}'
+            for u, v in [(left, top), (left, bottom), (top, bottom),
+                         (top, right), (bottom, right)]:
+                G.add_edge(u, v, capacitance=10e-12)
+
+        ceq, warning = calculate_graph_ceq(G, 'A', 'B')
+
+        assert abs(ceq - 0.4e-12) / 0.4e-12 < 1e-10
+        assert warning is None
+
+    def test_matches_dense_solve(self):
+        """Test that sparse and dense voltages agree on a meshed network."""
+        rng = np.random.default_rng(0)
+        G = nx.grid_2d_graph(6, 6)
+        for u, v in G.edges():
+            G[u][v]['capacitance'] = rng.uniform(1e-12, 10e-12)
+        nodes = list(G.nodes())
+        edges = _indexed_edges(G, nodes)
+        internal = list(range(1, len(nodes) - 1))
+
+        sparse = _solve_sparse(len(nodes), edges, internal, 0)
+        dense, _ = _solve_dense(len(nodes), edges, internal, 0)
+
+        assert np.allclose(sparse, dense, rtol=1e-10, atol=0)
+
+    def test_singular_system_returns_none(self):
+        """Test that a floating internal island is left to the dense path."""
+        G = nx.Graph()
+        G.add_edge('A', 'B', capacitance=1e-12)
+        G.add_edge('n1', 'n2', capacitance=1e-12)
+        nodes = list(G.nodes())
+
+        assert _solve_sparse(len(nodes), _indexed_edges(G, nodes), [2, 3], 0) is None
+
 
 class TestGraphTopologyToExpression:
     """Tests for graph_topology_to_expression function."""
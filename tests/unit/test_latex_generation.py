@@ -0,0 +1,89 @@
+"""
+Tests for LaTeX/CircuiTikZ code generation.
+
+Tests the siunitx capacitance formatting and the CircuiTikZ code emitted
+for series-parallel topologies by capassigner.ui.plots.
+"""
+
+import pytest
+
+from capassigner.core.sp_structures import Leaf, Series, Parallel
+from capassigner.ui.plots import (
+    _compile_sp_template,
+    _format_capacitance_latex,
+    generate_latex_code,
+)
+
+
+class TestCapacitanceLatexFormatting:
+    """Test siunitx formatting of capacitance values."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (5.2e-12, r"\SI{5.2}{\pico\farad}"),
+        (1e-9, r"\SI{1}{\nano\farad}"),
+        (4.7e-6, r"\SI{4.7}{\micro\farad}"),
+        (2.2e-3, r"\SI{2.2}{\milli\farad}"),
+        (1.5, r"\SI{1.5}{\farad}"),
+    ])
+    def test_unit_selection(self, value, expected):
+        """Test that each decade selects the matching SI prefix."""
+        assert _format_capacitance_latex(value) == expected
+
+    def test_zero_value(self):
+        """Test that zero is formatted without a prefix."""
+        assert _format_capacitance_latex(0) == r"\SI{0}{\farad}"
+
+    @pytest.mark.parametrize("value, expected", [
+        (float("nan"), r"\SI{nan}{\farad}"),
+        (float("inf"), r"\SI{inf}{\farad}"),
+        (float("-inf"), r"\SI{-inf}{\farad}"),
+    ])
+    def test_non_finite_values(self, value, expected):
+        """Test that NaN and infinities are formatted without a prefix."""
+        assert _format_capacitance_latex(value) == expected
+
+    def test_out_of_range_values_clamp(self):
+        """Test that values below 1pF and above 1kF clamp to pF and F."""
+        assert _format_capacitance_latex(1e-15) == r"\SI{0.001}{\pico\farad}"
+        assert _format_capacitance_latex(2e3) == r"\SI{2000}{\farad}"
+
+
+class TestSPLatexGeneration:
+    """Test CircuiTikZ code emitted for SP topologies."""
+
+    def test_series_chains_from_end_anchor(self):
+        """Test that the right branch of a series starts at (end)."""
+        code = generate_latex_code(Series(Leaf(0, 1e-12), Leaf(1, 2e-12)))
+        assert r"\draw (0,0) to[C, l={C1}] ++(2,0) coordinate (end);" in code
+        assert r"\draw (end) to[C, l={C2}] ++(2,0) coordinate (end);" in code
+
+    def test_default_labels_cover_highest_index(self):
+        """Test that default labels are generated up to the highest index."""
+        code = generate_latex_code(Parallel(Leaf(0, 1e-12), Leaf(2, 2e-12)))
+        assert "l={C1}" in code
+        assert "l={C3}" in code
+
+    def test_values_included_in_labels(self):
+        """Test that capacitor values are rendered with siunitx."""
+        code = generate_latex_code(Leaf(0, 5e-12), ["C1"], [5e-12])
+        assert r"l={C1=\SI{5}{\pico\farad}}" in code
+
+
+class TestSPLatexTemplates:
+    """Test per-shape CircuiTikZ template compilation."""
+
+    def test_same_shape_shares_template(self):
+        """Test that trees differing only in values reuse one template."""
+        first = Parallel(Leaf(0, 1e-12), Series(Leaf(1, 2e-12), Leaf(2, 3e-12)))
+        second = Parallel(Leaf(0, 4e-9), Series(Leaf(1, 5e-9), Leaf(2, 6e-9)))
+        assert _compile_sp_template(first) is _compile_sp_template(second)
+
+    def test_index_order_follows_emission(self):
+        """Test that fields map to capacitor indices in emission order."""
+        _, index_order = _compile_sp_template(Series(Leaf(2, 1e-12), Leaf(0, 1e-12)))
+        assert index_order == (2, 0)
+
+    def test_labels_with_braces_are_inserted_verbatim(self):
+        """Test that label text is not interpreted as format fields."""
+        code = generate_latex_code(Leaf(0, 1e-12), ["C_{1}"])
+        assert "l={C_{1}}" in code
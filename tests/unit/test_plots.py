@@ -0,0 +1,40 @@
+"""
+Tests for matplotlib figure rendering in capassigner.ui.plots.
+"""
+
+import matplotlib
+matplotlib.use('Agg')  # Use non-GUI backend for testing
+import matplotlib.pyplot as plt
+
+from capassigner.ui.plots import _PlotContext, plot_error_distribution
+
+
+class TestErrorDistributionPlot:
+    """Test the solution error histogram."""
+
+    def test_histogram_counts_all_solutions(self):
+        """Test that every solution lands in a histogram bin."""
+        fig = plot_error_distribution(
+            [(None, 1e-12), (None, 2e-12), (None, 4e-12)], 2e-12
+        )
+        ax = fig.axes[0]
+        assert sum(patch.get_height() for patch in ax.patches) == 3
+        plt.close(fig)
+
+    def test_nearly_identical_errors(self):
+        """Test errors one ulp apart (1pF and 2pF around 1.5pF) still plot."""
+        fig = plot_error_distribution([(None, 1e-12), (None, 2e-12)], 1.5e-12)
+        ax = fig.axes[0]
+        assert [patch.get_height() for patch in ax.patches] == [2]
+        plt.close(fig)
+
+    def test_reuses_context_figure(self):
+        """Test that a context's figure is cleared and redrawn, not replaced."""
+        ctx = _PlotContext()
+        try:
+            first = plot_error_distribution([(None, 1e-12), (None, 3e-12)], 2e-12, ctx=ctx)
+            second = plot_error_distribution([(None, 5e-12)], 2e-12, ctx=ctx)
+            assert first is second is ctx.fig
+            assert sum(patch.get_height() for patch in ctx.ax.patches) == 1
+        finally:
+            ctx.close()
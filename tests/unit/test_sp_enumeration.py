@@ -14,10 +14,19 @@ Constitutional Compliance:
 from __future__ import annotations
 import pytest
 from capassigner.core.sp_enumeration import (
+    enumerate_sp_ceqs,
     enumerate_sp_topologies,
-    find_best_sp_solutions
+    find_best_sp_solutions,
+    rank_sp_topologies
+)
+from capassigner.core.sp_structures import (
+    Leaf,
+    Series,
+    Parallel,
+    calculate_sp_ceq,
+    sp_node_to_expression,
+    sp_node_to_normalized_expression,
 )
-from capassigner.core.sp_structures import Leaf, Series, Parallel, calculate_sp_ceq
 
 
 class TestEnumerationBasicCases:
@@ -182,6 +191,26 @@ class TestProgressCallback:
         assert len(topologies) > 0
 
 
+class TestEnumerateCeqs:
+    """Test array-based C_eq enumeration."""
+
+    def test_aligned_with_topologies(self):
+        """Test that entry i is exactly the C_eq of topology i."""
+        capacitors = [1e-12, 2.2e-12, 4.7e-12, 10e-12]
+
+        ceqs = enumerate_sp_ceqs(capacitors)
+        topologies = enumerate_sp_topologies(capacitors)
+
+        assert ceqs.tolist() == [calculate_sp_ceq(t) for t in topologies]
+
+    def test_invalid_input_rejected(self):
+        """Test the same validation as enumerate_sp_topologies."""
+        with pytest.raises(ValueError):
+            enumerate_sp_ceqs([])
+        with pytest.raises(ValueError):
+            enumerate_sp_ceqs([1e-12, 0.0])
+
+
 class TestFindBestSPSolutions:
     """Test integrated find_best_sp_solutions function."""
 
@@ -262,3 +291,44 @@ class TestFindBestSPSolutions:
         # Should have valid expression
         assert "C" in best_solution.expression
         assert any(op in best_solution.expression for op in ["+", "||"])
+
+    def test_find_best_bounded_dedup_matches_full_scan(self):
+        """Test that bounded deduplication keeps the same top K as a full scan."""
+        capacitors = [1e-12, 1e-12, 2.2e-12, 4.7e-12, 10e-12]
+        labels = [f"C{i+1}" for i in range(len(capacitors))]
+        topologies = enumerate_sp_topologies(capacitors)
+        target = calculate_sp_ceq(topologies[len(topologies) // 2])
+
+        seen = set()
+        expected = []
+        for topology in topologies:
+            key = sp_node_to_normalized_expression(topology, labels)
+            if key not in seen:
+                seen.add(key)
+                expected.append((abs(calculate_sp_ceq(topology) - target),
+                                 sp_node_to_expression(topology, labels)))
+        expected = [expression for _, expression in sorted(expected, key=lambda e: e[0])[:10]]
+
+        solutions = find_best_sp_solutions(capacitors, target, top_k=10)
+
+        assert [s.expression for s in solutions] == expected
+
+    def test_rank_pre_enumerated_matches_find_best(self):
+        """Test that ranking stored topologies gives the find_best result."""
+        capacitors = [1e-12, 2.2e-12, 4.7e-12, 10e-12]
+        topologies = enumerate_sp_topologies(capacitors)
+
+        for target in (3e-12, 7.7e-12, 15e-12):
+            expected = [(s.expression, s.ceq)
+                        for s in find_best_sp_solutions(capacitors, target, top_k=5)]
+            ranked = rank_sp_topologies(topologies, capacitors, target, top_k=5)
+            assert [(s.expression, s.ceq) for s in ranked] == expected
+
+    def test_rank_rejects_invalid_target(self):
+        """Test that rank_sp_topologies validates target and tolerance."""
+        topologies = enumerate_sp_topologies([1e-12, 2e-12])
+
+        with pytest.raises(ValueError):
+            rank_sp_topologies(topologies, [1e-12, 2e-12], 0.0)
+        with pytest.raises(ValueError):
+            rank_sp_topologies(topologies, [1e-12, 2e-12], 1e-12, tolerance=-1.0)
@@ -1,8 +1,16 @@
 """Unit tests for SP Graph Exhaustive module."""
 
+from multiprocessing import get_context
+
 import pytest
 import networkx as nx
-from capassigner.core.sp_graph_exhaustive import solve, generate_topologies, is_sp_reducible
+from capassigner.core.sp_graph_exhaustive import (
+    _connected_candidates,
+    _unique_candidates,
+    solve,
+    generate_topologies,
+    is_sp_reducible,
+)
 
 def test_generate_topologies_n2():
     """Test topology generation for N=2 edges."""
@@ -17,6 +25,13 @@ def test_generate_topologies_n2():
     nodes_counts = sorted([G.number_of_nodes() for G in topos])
     assert nodes_counts == [2, 3]
 
+def test_unique_candidates_pool_matches_map():
+    """Test that the spawn-pool dedup keeps the same candidates, in order, as map."""
+    with get_context("spawn").Pool(2) as pool:
+        for num_edges in (4, 5):
+            candidates = _connected_candidates(num_edges)
+            assert _unique_candidates(candidates, pool.map) == _unique_candidates(candidates, map)
+
 def test_is_sp_reducible_series():
     """Test reduction of simple series circuit."""
     G = nx.MultiGraph()
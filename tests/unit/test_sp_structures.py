@@ -19,7 +19,9 @@ from capassigner.core.sp_structures import (
     Parallel,
     SPNode,
     calculate_sp_ceq,
-    sp_node_to_expression
+    sp_node_to_expression,
+    sp_node_to_normalized_expression,
+    sp_nodes_to_normalized_expressions
 )
 
 
@@ -202,6 +204,33 @@ class TestSingleCapacitor:
         assert result == 5.2e-12
 
 
+class TestNodeKindTags:
+    """Test class-level KIND tags used for fast node-type dispatch."""
+
+    def test_kind_tags_are_distinct(self):
+        """Test that Leaf, Series and Parallel carry tags 0, 1 and 2."""
+        leaf = Leaf(0, 5e-12)
+        assert leaf.KIND == 0
+        assert Series(leaf, leaf).KIND == 1
+        assert Parallel(leaf, leaf).KIND == 2
+
+    def test_kind_is_not_a_dataclass_field(self):
+        """Test that KIND does not change the constructor or equality."""
+        from dataclasses import fields
+        assert [f.name for f in fields(Leaf)] == ["capacitor_index", "value"]
+        assert [f.name for f in fields(Series)] == ["left", "right"]
+
+    def test_nodes_are_slotted_and_copyable(self):
+        """Test that nodes have no __dict__ yet survive pickle and deepcopy."""
+        import copy
+        import pickle
+        topology = Series(Leaf(0, 5e-12), Parallel(Leaf(1, 1e-12), Leaf(2, 2e-12)))
+        assert not hasattr(topology, "__dict__")
+        assert not hasattr(topology.left, "__dict__")
+        assert pickle.loads(pickle.dumps(topology)) == topology
+        assert copy.deepcopy(topology) == topology
+
+
 class TestExpressionGeneration:
     """Test topology expression string generation."""
 
@@ -260,6 +289,23 @@ class TestExpressionGeneration:
         assert expr == "(((C1+C2)||C3)+C4)"
 
 
+class TestBatchNormalization:
+    """Test batch normalization over shared subtrees."""
+
+    def test_matches_single_normalization(self):
+        """Test that shared subtrees normalize the same as fresh ones."""
+        labels = ["C1", "C2", "C3", "C4"]
+        shared = Series(Leaf(1, 2e-12), Leaf(2, 3e-12))
+        nodes = [
+            Parallel(Leaf(0, 1e-12), shared),
+            Series(shared, Leaf(0, 1e-12)),
+            Series(Series(Leaf(3, 4e-12), shared), Parallel(Leaf(0, 1e-12), shared)),
+            Leaf(3, 4e-12),
+        ]
+        expected = [sp_node_to_normalized_expression(n, labels) for n in nodes]
+        assert sp_nodes_to_normalized_expressions(nodes, labels) == expected
+
+
 class TestInvalidInput:
     """Test error handling for invalid inputs."""
 